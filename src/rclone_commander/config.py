@@ -15,13 +15,27 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import io
 import os
-import configparser
-from typing import Dict, List, Optional, NamedTuple
+import sys
+import functools
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, KeysView, Optional, Tuple
 from pathlib import Path
 
+from .fast_ini import parse_ini, parse_ini_files, set_ini_option_text
 
-class AppConfig(NamedTuple):
+if TYPE_CHECKING:
+    import configparser
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain dataclass
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class AppConfig:
     """Application configuration settings."""
     # General
     default_left_remote: str
@@ -48,18 +62,18 @@ class AppConfig(NamedTuple):
     progress_log_retention: int
     progress_stats_interval: str
     # Key bindings
-    key_quit: str
-    key_switch_panel: str
-    key_swap_panels: str
-    key_copy: str
-    key_move: str
-    key_make_directory: str
-    key_delete: str
-    key_navigate: str
-    key_select_remote: str
-    key_toggle_select: str
-    key_refresh_panel: str
-    key_show_dir_size: str
+    key_quit: Tuple[str, ...]
+    key_switch_panel: Tuple[str, ...]
+    key_swap_panels: Tuple[str, ...]
+    key_copy: Tuple[str, ...]
+    key_move: Tuple[str, ...]
+    key_make_directory: Tuple[str, ...]
+    key_delete: Tuple[str, ...]
+    key_navigate: Tuple[str, ...]
+    key_select_remote: Tuple[str, ...]
+    key_toggle_select: Tuple[str, ...]
+    key_refresh_panel: Tuple[str, ...]
+    key_show_dir_size: Tuple[str, ...]
     # Status bar labels
     label_copy: str
     label_move: str
@@ -70,239 +84,359 @@ class AppConfig(NamedTuple):
     label_quit: str
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ResolvedPaths:
+    """File system paths resolved once at startup."""
+    rclone: str
+    rclone_conf: str
+    app_ini: str
+    app_ini_layers: Tuple[str, ...]
+    user_app_ini: str
+
+
+@functools.lru_cache(maxsize=1)
 def get_rclone_path() -> str:
     """Get rclone executable path from environment or default."""
     return os.environ.get('RCLONE_PATH', 'rclone')
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> str:
     """Get rclone config file path from environment or default."""
     return os.environ.get('RCLONE_CONFIG',
                          os.path.expanduser('~/.config/rclone/rclone.conf'))
 
 
+# App config candidates, built once at import
+_USER_APP_CONFIG = Path.home() / '.config' / 'rclone-commander' / 'rclone-commander.ini'
+_PACKAGE_APP_CONFIG = Path(__file__).absolute().parent / 'config' / 'rclone-commander.ini'
+_BASE_APP_CONFIG_CANDIDATES = (
+    # Package config (bundled with installation)
+    _PACKAGE_APP_CONFIG,
+    # Legacy location - config/ directory (backwards compatibility)
+    Path('config') / 'rclone-commander.ini',
+    # Legacy location - current directory (backwards compatibility)
+    Path('rclone-commander.ini'),
+)
+
+
+def _dir_contains(dir_path: Path, name: str) -> bool:
+    """Return True if dir_path has a regular file called name.
+
+    Uses one readdir (os.scandir) per directory; is_file() is answered from
+    the directory entry's d_type on most file systems without a stat.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return any(entry.name == name and entry.is_file() for entry in it)
+    except OSError:
+        return False
+
+
+def _is_file(path: Path) -> bool:
+    """Return True if path is an existing regular file."""
+    return _dir_contains(path.parent, path.name)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_config_layers() -> Tuple[str, ...]:
+    """Get the existing app config files, lowest priority first.
+
+    The base layer is the package config (bundled default), or one of the
+    legacy locations config/rclone-commander.ini, ./rclone-commander.ini
+    when the package config is missing. The user config, if present, is
+    layered on top and only needs to contain the keys it overrides.
+
+    The result is cached for the process lifetime; writers that create a
+    new config file must call get_app_config_layers.cache_clear().
+    """
+    layers = []
+    for candidate in _BASE_APP_CONFIG_CANDIDATES:
+        if _is_file(candidate):
+            layers.append(str(candidate.absolute()))
+            break
+
+    # User config directory (highest priority)
+    if _is_file(_USER_APP_CONFIG):
+        layers.append(str(_USER_APP_CONFIG))
+
+    return tuple(layers)
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_config_path() -> str:
-    """Get application config file path.
+    """Get the highest-priority application config file path.
 
     Search priority:
     1. User config: ~/.config/rclone-commander/rclone-commander.ini (highest priority)
     2. Package config: <package>/config/rclone-commander.ini (bundled default)
     3. Legacy locations: config/rclone-commander.ini, ./rclone-commander.ini (backwards compatibility)
+
+    See get_app_config_layers() for how the files are combined.
     """
-    # 1. User config directory (highest priority)
-    user_config_dir = os.path.expanduser('~/.config/rclone-commander/')
-    user_config = os.path.join(user_config_dir, 'rclone-commander.ini')
-    if os.path.exists(user_config):
-        return user_config
-
-    # 2. Package config (bundled with installation)
-    package_dir = os.path.dirname(os.path.abspath(__file__))
-    package_config = os.path.join(package_dir, 'config', 'rclone-commander.ini')
-    if os.path.exists(package_config):
-        return package_config
-
-    # 3. Legacy location - config/ directory (backwards compatibility)
-    legacy_config_dir = os.path.join(os.getcwd(), 'config', 'rclone-commander.ini')
-    if os.path.exists(legacy_config_dir):
-        return legacy_config_dir
-
-    # 4. Legacy location - current directory (backwards compatibility)
-    legacy_local = os.path.join(os.getcwd(), 'rclone-commander.ini')
-    if os.path.exists(legacy_local):
-        return legacy_local
+    layers = get_app_config_layers()
+    if layers:
+        return layers[-1]
 
     # Fallback: Return package config path (will be created on first run if needed)
-    return package_config
+    return str(_PACKAGE_APP_CONFIG)
+
+
+# Same boolean spellings configparser.getboolean() accepts
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def _to_bool(value: str) -> bool:
+    """Convert an INI boolean string, rejecting unknown spellings."""
+    try:
+        return _BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
+
+
+def _to_keys(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated key binding ('f8,delete') into interned keys."""
+    return tuple(sys.intern(k.strip()) for k in value.split(',') if k.strip())
+
+
+# 'enum' values come from a small closed vocabulary; interning them makes
+# downstream == / dict-key comparisons pointer-equal
+_CONVERTERS = {'str': str, 'enum': sys.intern, 'keys': _to_keys, 'bool': _to_bool, 'int': int}
+
+# (AppConfig field, INI section, INI key, kind, typed default)
+_SCHEMA = [
+    # General
+    ('default_left_remote', 'General', 'default_left_remote', 'str', ''),
+    ('default_right_remote', 'General', 'default_right_remote', 'str', 'local'),
+    ('local_default_path', 'General', 'local_default_path', 'str', ''),  # Empty means home directory
+    ('app_title', 'General', 'app_title', 'str', 'Rclone Commander'),
+    ('debug', 'General', 'debug', 'bool', False),
+    ('extra_rclone_flags', 'General', 'extra_rclone_flags', 'str', ''),
+    ('local_remote_prompted', 'General', 'local_remote_prompted', 'bool', False),
+    # Display
+    ('color_scheme', 'Display', 'color_scheme', 'enum', 'dark'),
+    ('show_hidden', 'Display', 'show_hidden', 'bool', True),
+    ('size_format', 'Display', 'size_format', 'enum', 'auto'),
+    ('border_style', 'Display', 'border_style', 'enum', 'solid'),
+    ('active_border_color', 'Display', 'active_border_color', 'enum', 'accent'),
+    ('inactive_border_color', 'Display', 'inactive_border_color', 'enum', 'primary'),
+    # Behavior
+    ('confirm_copy', 'Behavior', 'confirm_copy', 'bool', True),
+    ('confirm_move', 'Behavior', 'confirm_move', 'bool', True),
+    ('confirm_delete', 'Behavior', 'confirm_delete', 'bool', True),
+    ('confirm_overwrite', 'Behavior', 'confirm_overwrite', 'bool', True),
+    ('follow_symlinks', 'Behavior', 'follow_symlinks', 'bool', False),
+    ('auto_refresh', 'Behavior', 'auto_refresh', 'int', 0),
+    ('progress_log_retention', 'Behavior', 'progress_log_retention', 'int', 5),
+    ('progress_stats_interval', 'Behavior', 'progress_stats_interval', 'str', '1s'),
+    # Key bindings
+    ('key_quit', 'KeyBindings', 'quit', 'keys', ('q',)),
+    ('key_switch_panel', 'KeyBindings', 'switch_panel', 'keys', ('tab',)),
+    ('key_swap_panels', 'KeyBindings', 'swap_panels', 'keys', ('ctrl+u',)),
+    ('key_copy', 'KeyBindings', 'copy', 'keys', ('f5',)),
+    ('key_move', 'KeyBindings', 'move', 'keys', ('f6',)),
+    ('key_make_directory', 'KeyBindings', 'make_directory', 'keys', ('f7',)),
+    ('key_delete', 'KeyBindings', 'delete', 'keys', ('f8', 'delete')),
+    ('key_navigate', 'KeyBindings', 'navigate', 'keys', ('enter',)),
+    ('key_select_remote', 'KeyBindings', 'select_remote', 'keys', ('f10',)),
+    ('key_toggle_select', 'KeyBindings', 'toggle_select', 'keys', ('space', 'insert')),
+    ('key_refresh_panel', 'KeyBindings', 'refresh_panel', 'keys', ('ctrl+r',)),
+    ('key_show_dir_size', 'KeyBindings', 'show_dir_size', 'keys', ('ctrl+i',)),
+    # Status bar labels
+    ('label_copy', 'StatusBar', 'copy_label', 'str', 'Copy'),
+    ('label_move', 'StatusBar', 'move_label', 'str', 'Move'),
+    ('label_delete', 'StatusBar', 'delete_label', 'str', 'Delete'),
+    ('label_remotes', 'StatusBar', 'remotes_label', 'str', 'Remotes'),
+    ('label_select', 'StatusBar', 'select_label', 'str', 'Select'),
+    ('label_switch', 'StatusBar', 'switch_label', 'str', 'Switch'),
+    ('label_quit', 'StatusBar', 'quit_label', 'str', 'Quit'),
+]
+
+
+# (AppConfig field, action name) for every [KeyBindings] entry, in schema order
+_KEY_ACTIONS = tuple((name, key) for name, section, key, _, _ in _SCHEMA if section == 'KeyBindings')
+
+
+@functools.lru_cache(maxsize=4)
+def get_keybindings_map(app_config: AppConfig) -> Dict[str, str]:
+    """Get a {key: action} map for app_config's key bindings.
+
+    Multi-key bindings such as ('f8', 'delete') contribute one entry per
+    key. Computed once per AppConfig; treat the result as read-only.
+    """
+    keymap = {}
+    for field, action in _KEY_ACTIONS:
+        for key in getattr(app_config, field):
+            keymap[key] = action
+    return keymap
+
+
+# Parsed AppConfig keyed by the (path, mtime) of each layer (mtime None if
+# the file is missing) so repeated loads are a dict lookup
+_APP_CONFIG_CACHE: Dict[Tuple[Tuple[str, Optional[float]], ...], AppConfig] = {}
+
+
+def invalidate_app_config_cache() -> None:
+    """Drop cached AppConfig instances (call after writing the app config)."""
+    _APP_CONFIG_CACHE.clear()
 
 
 def load_app_config() -> AppConfig:
-    """Load application configuration from rclone-commander.ini."""
-    config_path = get_app_config_path()
-
-    # Default values
-    defaults = {
-        # General
-        'default_left_remote': '',
-        'default_right_remote': 'local',
-        'local_default_path': '',  # Empty means home directory
-        'app_title': 'Rclone Commander',
-        'debug': 'false',
-        'extra_rclone_flags': '',
-        'local_remote_prompted': 'false',
-        # Display
-        'color_scheme': 'dark',
-        'show_hidden': 'true',
-        'size_format': 'auto',
-        'border_style': 'solid',
-        'active_border_color': 'accent',
-        'inactive_border_color': 'primary',
-        # Behavior
-        'confirm_copy': 'true',
-        'confirm_move': 'true',
-        'confirm_delete': 'true',
-        'confirm_overwrite': 'true',
-        'follow_symlinks': 'false',
-        'auto_refresh': '0',
-        'progress_log_retention': '5',
-        'progress_stats_interval': '1s',
-        # Key bindings
-        'quit': 'q',
-        'switch_panel': 'tab',
-        'swap_panels': 'ctrl+u',
-        'copy': 'f5',
-        'move': 'f6',
-        'make_directory': 'f7',
-        'delete': 'f8,delete',
-        'navigate': 'enter',
-        'select_remote': 'f10',
-        'toggle_select': 'space,insert',
-        'refresh_panel': 'ctrl+r',
-        'show_dir_size': 'ctrl+i',
-        # Status bar labels
-        'copy_label': 'Copy',
-        'move_label': 'Move',
-        'delete_label': 'Delete',
-        'remotes_label': 'Remotes',
-        'select_label': 'Select',
-        'switch_label': 'Switch',
-        'quit_label': 'Quit',
-    }
-
-    if os.path.exists(config_path):
-        parser = configparser.ConfigParser()
-        parser.read(config_path)
-
-        return AppConfig(
-            # General
-            default_left_remote=parser.get('General', 'default_left_remote', fallback=defaults['default_left_remote']),
-            default_right_remote=parser.get('General', 'default_right_remote', fallback=defaults['default_right_remote']),
-            local_default_path=parser.get('General', 'local_default_path', fallback=defaults['local_default_path']),
-            app_title=parser.get('General', 'app_title', fallback=defaults['app_title']),
-            debug=parser.getboolean('General', 'debug', fallback=defaults['debug'] == 'true'),
-            extra_rclone_flags=parser.get('General', 'extra_rclone_flags', fallback=defaults['extra_rclone_flags']),
-            local_remote_prompted=parser.getboolean('General', 'local_remote_prompted', fallback=defaults['local_remote_prompted'] == 'true'),
-            # Display
-            color_scheme=parser.get('Display', 'color_scheme', fallback=defaults['color_scheme']),
-            show_hidden=parser.getboolean('Display', 'show_hidden', fallback=defaults['show_hidden'] == 'true'),
-            size_format=parser.get('Display', 'size_format', fallback=defaults['size_format']),
-            border_style=parser.get('Display', 'border_style', fallback=defaults['border_style']),
-            active_border_color=parser.get('Display', 'active_border_color', fallback=defaults['active_border_color']),
-            inactive_border_color=parser.get('Display', 'inactive_border_color', fallback=defaults['inactive_border_color']),
-            # Behavior
-            confirm_copy=parser.getboolean('Behavior', 'confirm_copy', fallback=defaults['confirm_copy'] == 'true'),
-            confirm_move=parser.getboolean('Behavior', 'confirm_move', fallback=defaults['confirm_move'] == 'true'),
-            confirm_delete=parser.getboolean('Behavior', 'confirm_delete', fallback=defaults['confirm_delete'] == 'true'),
-            confirm_overwrite=parser.getboolean('Behavior', 'confirm_overwrite', fallback=defaults['confirm_overwrite'] == 'true'),
-            follow_symlinks=parser.getboolean('Behavior', 'follow_symlinks', fallback=defaults['follow_symlinks'] == 'true'),
-            auto_refresh=parser.getint('Behavior', 'auto_refresh', fallback=int(defaults['auto_refresh'])),
-            progress_log_retention=parser.getint('Behavior', 'progress_log_retention', fallback=int(defaults['progress_log_retention'])),
-            progress_stats_interval=parser.get('Behavior', 'progress_stats_interval', fallback=defaults['progress_stats_interval']),
-            # Key bindings
-            key_quit=parser.get('KeyBindings', 'quit', fallback=defaults['quit']),
-            key_switch_panel=parser.get('KeyBindings', 'switch_panel', fallback=defaults['switch_panel']),
-            key_swap_panels=parser.get('KeyBindings', 'swap_panels', fallback=defaults['swap_panels']),
-            key_copy=parser.get('KeyBindings', 'copy', fallback=defaults['copy']),
-            key_move=parser.get('KeyBindings', 'move', fallback=defaults['move']),
-            key_make_directory=parser.get('KeyBindings', 'make_directory', fallback=defaults['make_directory']),
-            key_delete=parser.get('KeyBindings', 'delete', fallback=defaults['delete']),
-            key_navigate=parser.get('KeyBindings', 'navigate', fallback=defaults['navigate']),
-            key_select_remote=parser.get('KeyBindings', 'select_remote', fallback=defaults['select_remote']),
-            key_toggle_select=parser.get('KeyBindings', 'toggle_select', fallback=defaults['toggle_select']),
-            key_refresh_panel=parser.get('KeyBindings', 'refresh_panel', fallback=defaults['refresh_panel']),
-            key_show_dir_size=parser.get('KeyBindings', 'show_dir_size', fallback=defaults['show_dir_size']),
-            # Status bar labels
-            label_copy=parser.get('StatusBar', 'copy_label', fallback=defaults['copy_label']),
-            label_move=parser.get('StatusBar', 'move_label', fallback=defaults['move_label']),
-            label_delete=parser.get('StatusBar', 'delete_label', fallback=defaults['delete_label']),
-            label_remotes=parser.get('StatusBar', 'remotes_label', fallback=defaults['remotes_label']),
-            label_select=parser.get('StatusBar', 'select_label', fallback=defaults['select_label']),
-            label_switch=parser.get('StatusBar', 'switch_label', fallback=defaults['switch_label']),
-            label_quit=parser.get('StatusBar', 'quit_label', fallback=defaults['quit_label']),
-        )
-    else:
-        # Return defaults if config doesn't exist
-        return AppConfig(
-            # General
-            default_left_remote=defaults['default_left_remote'],
-            default_right_remote=defaults['default_right_remote'],
-            local_default_path=defaults['local_default_path'],
-            app_title=defaults['app_title'],
-            debug=defaults['debug'] == 'true',
-            extra_rclone_flags=defaults['extra_rclone_flags'],
-            local_remote_prompted=defaults['local_remote_prompted'] == 'true',
-            # Display
-            color_scheme=defaults['color_scheme'],
-            show_hidden=defaults['show_hidden'] == 'true',
-            size_format=defaults['size_format'],
-            border_style=defaults['border_style'],
-            active_border_color=defaults['active_border_color'],
-            inactive_border_color=defaults['inactive_border_color'],
-            # Behavior
-            confirm_copy=defaults['confirm_copy'] == 'true',
-            confirm_move=defaults['confirm_move'] == 'true',
-            confirm_delete=defaults['confirm_delete'] == 'true',
-            confirm_overwrite=defaults['confirm_overwrite'] == 'true',
-            follow_symlinks=defaults['follow_symlinks'] == 'true',
-            auto_refresh=int(defaults['auto_refresh']),
-            progress_log_retention=int(defaults['progress_log_retention']),
-            progress_stats_interval=defaults['progress_stats_interval'],
-            # Key bindings
-            key_quit=defaults['quit'],
-            key_switch_panel=defaults['switch_panel'],
-            key_swap_panels=defaults['swap_panels'],
-            key_copy=defaults['copy'],
-            key_move=defaults['move'],
-            key_make_directory=defaults['make_directory'],
-            key_delete=defaults['delete'],
-            key_navigate=defaults['navigate'],
-            key_select_remote=defaults['select_remote'],
-            key_toggle_select=defaults['toggle_select'],
-            key_refresh_panel=defaults['refresh_panel'],
-            key_show_dir_size=defaults['show_dir_size'],
-            # Status bar labels
-            label_copy=defaults['copy_label'],
-            label_move=defaults['move_label'],
-            label_delete=defaults['delete_label'],
-            label_remotes=defaults['remotes_label'],
-            label_select=defaults['select_label'],
-            label_switch=defaults['switch_label'],
-            label_quit=defaults['quit_label'],
-        )
+    """Load application configuration from rclone-commander.ini.
 
+    The user config is merged on top of the bundled config. The result is
+    cached per (path, mtime) of every layer; editing a file or calling
+    invalidate_app_config_cache() forces a re-parse.
+    """
+    layers = PATHS.app_ini_layers
+    cache_key = []
+    for config_path in layers:
+        try:
+            mtime = os.stat(config_path).st_mtime
+        except OSError:
+            mtime = None
+        cache_key.append((config_path, mtime))
+    cache_key = tuple(cache_key)
+
+    cached = _APP_CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Only the layers just stat'ed as present; no second existence check
+    app_config = _parse_app_config(tuple(path for path, mtime in cache_key if mtime is not None))
+    _APP_CONFIG_CACHE[cache_key] = app_config
+    return app_config
+
+
+def _parse_app_config(config_paths: Tuple[str, ...]) -> AppConfig:
+    """Parse and merge the given rclone-commander.ini layers into an AppConfig.
+
+    config_paths must exist (load_app_config passes only those it found).
+    Missing sections or keys fall back to the _SCHEMA defaults.
+    """
+    sections = parse_ini_files(config_paths)
 
-def load_remotes(config_path: str) -> Dict[str, Dict[str, str]]:
-    """Load remotes from rclone configuration file."""
-    if not os.path.exists(config_path):
-        return {}
+    values = {}
+    for name, section, key, kind, default in _SCHEMA:
+        raw = sections.get(section, {}).get(key)
+        # Defaults are already typed; only values read from the INI are converted
+        values[name] = default if raw is None else _CONVERTERS[kind](raw)
+    return AppConfig(**values)
+
+
+class RcloneConfigStore:
+    """mtime-validated cache of parsed rclone.conf files.
 
-    parser = configparser.ConfigParser()
-    parser.read(config_path)
+    Startup reads rclone.conf from load_remotes(), has_local_remote() and
+    add_local_remote(); the file is only re-parsed when its mtime changes.
+    """
+
+    def __init__(self):
+        self._cache: Dict[str, Tuple[float, Dict[str, Dict[str, str]]]] = {}
+
+    def load(self, config_path: str) -> Dict[str, Dict[str, str]]:
+        """Return {remote: options} for config_path ({} if it doesn't exist)."""
+        try:
+            mtime = os.stat(config_path).st_mtime
+        except OSError:
+            self._cache.pop(config_path, None)
+            return {}
 
-    remotes = {}
-    for section in parser.sections():
-        remotes[section] = dict(parser[section])
+        cached = self._cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-    return remotes
+        sections = parse_ini(config_path)
+        self._cache[config_path] = (mtime, sections)
+        return sections
 
+    def invalidate(self, config_path: Optional[str] = None) -> None:
+        """Forget the cached parse for config_path (or for every file)."""
+        if config_path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(config_path, None)
 
-def get_remote_names(remotes: Dict[str, Dict[str, str]]) -> List[str]:
-    """Get list of configured remote names."""
-    return list(remotes.keys())
 
+_rclone_config_store = RcloneConfigStore()
 
-def get_remote_info(remotes: Dict[str, Dict[str, str]], remote: str) -> Optional[Dict[str, str]]:
-    """Get configuration for a specific remote."""
-    return remotes.get(remote)
+
+def _atomic_write_text(path: str, content: str) -> None:
+    """Write content to path via a temp file and os.replace().
+
+    A crash mid-write leaves the old file intact. The existing file's
+    permission bits are kept (rclone.conf is often 0600) and symlinks are
+    followed so the link itself is not replaced by a regular file.
+    """
+    path = os.path.realpath(path)
+    tmp_path = path + '.tmp'
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = None
+
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave the temp file next to the user's config
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# One write parser per thread, reset between uses instead of re-allocated
+_write_parser_local = threading.local()
+
+
+def _get_write_parser() -> 'configparser.ConfigParser':
+    """Get an empty ConfigParser for read-modify-write of INI files.
+
+    Interpolation is disabled (values are written back verbatim) and keys
+    keep their original case instead of being folded by optionxform.
+    configparser is imported here because reads go through fast_ini and
+    only the write paths need it.
+    """
+    parser = getattr(_write_parser_local, 'parser', None)
+    if parser is None:
+        import configparser
+
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.optionxform = str
+        _write_parser_local.parser = parser
+    else:
+        # ConfigParser.clear() refuses to drop the DEFAULT section, so reset by hand
+        for section in parser.sections():
+            parser.remove_section(section)
+        parser.defaults().clear()
+    return parser
+
+
+def load_remotes(config_path: str) -> Dict[str, Dict[str, str]]:
+    """Load remotes from rclone configuration file.
+
+    Returns the store's parsed {remote: options} dict as-is, with no
+    per-section copies; treat it as read-only.
+    """
+    return _rclone_config_store.load(config_path)
+
+
+def get_remote_names(remotes: Dict[str, Dict[str, str]]) -> KeysView[str]:
+    """Get configured remote names as a live view (no list copy)."""
+    return remotes.keys()
 
 
 def has_local_remote(config_path: str) -> bool:
     """Check if [local] remote exists in rclone configuration."""
-    if not os.path.exists(config_path):
-        return False
-
-    parser = configparser.ConfigParser()
-    parser.read(config_path)
-    return parser.has_section('local')
+    return 'local' in _rclone_config_store.load(config_path)
 
 
 def add_local_remote(config_path: str) -> bool:
@@ -317,24 +451,26 @@ def add_local_remote(config_path: str) -> bool:
         if config_dir and not os.path.exists(config_dir):
             os.makedirs(config_dir, exist_ok=True)
 
-        parser = configparser.ConfigParser()
+        # Check if [local] already exists (served from the parse cache)
+        if 'local' in _rclone_config_store.load(config_path):
+            return False
+
+        parser = _get_write_parser()
 
         # Read existing config if it exists
         if os.path.exists(config_path):
             parser.read(config_path)
 
-        # Check if [local] already exists
-        if parser.has_section('local'):
-            return False
-
         # Add [local] section
         parser.add_section('local')
         parser.set('local', 'type', 'local')
 
-        # Write back to file
-        with open(config_path, 'w') as f:
-            parser.write(f)
+        # Render in memory, then write back to file in one go
+        buf = io.StringIO()
+        parser.write(buf)
+        _atomic_write_text(config_path, buf.getvalue())
 
+        _rclone_config_store.invalidate(config_path)
         return True
     except Exception as e:
         # Log error but don't crash
@@ -348,47 +484,54 @@ def get_user_app_config_path() -> str:
     Returns the user config path (~/.config/rclone-commander/rclone-commander.ini).
     This is the preferred location for writing user preferences.
     """
-    user_config_dir = os.path.expanduser('~/.config/rclone-commander/')
-    return os.path.join(user_config_dir, 'rclone-commander.ini')
+    return str(_USER_APP_CONFIG)
+
+
+def resolve_paths() -> ResolvedPaths:
+    """Resolve the rclone binary, rclone.conf and app config paths."""
+    return ResolvedPaths(
+        rclone=get_rclone_path(),
+        rclone_conf=get_config_path(),
+        app_ini=get_app_config_path(),
+        app_ini_layers=get_app_config_layers(),
+        user_app_ini=get_user_app_config_path(),
+    )
+
+
+# Resolved once at import; rebound by writers that change which files exist
+PATHS = resolve_paths()
 
 
 def mark_local_remote_prompted() -> bool:
     """Mark that we've prompted the user about [local] remote.
 
-    Writes the flag to user's app config file.
+    Writes only the flag to the user's app config file; every other setting
+    keeps coming from the package config underneath it.
     Returns True if successful, False otherwise.
     """
+    global PATHS
     try:
-        user_config_path = get_user_app_config_path()
+        user_config_path = PATHS.user_app_ini
         user_config_dir = os.path.dirname(user_config_path)
 
         # Create user config directory if it doesn't exist
         if not os.path.exists(user_config_dir):
             os.makedirs(user_config_dir, exist_ok=True)
 
-        # If user config doesn't exist, copy from package config or create new
-        if not os.path.exists(user_config_path):
-            # Try to copy from current config
-            current_config = get_app_config_path()
-            if os.path.exists(current_config):
-                import shutil
-                shutil.copy(current_config, user_config_path)
-
-        # Load and update the config
-        parser = configparser.ConfigParser()
-        parser.read(user_config_path)
-
-        # Ensure [General] section exists
-        if not parser.has_section('General'):
-            parser.add_section('General')
-
-        # Set the flag
-        parser.set('General', 'local_remote_prompted', 'true')
+        # Update the flag in place if the user config exists, else start empty
+        content = ''
+        if os.path.exists(user_config_path):
+            with open(user_config_path) as f:
+                content = f.read()
+        content = set_ini_option_text(content, 'General', 'local_remote_prompted', 'true')
 
-        # Write back
-        with open(user_config_path, 'w') as f:
-            parser.write(f)
+        _atomic_write_text(user_config_path, content)
 
+        # The user config may not have existed before, so re-resolve the paths
+        get_app_config_layers.cache_clear()
+        get_app_config_path.cache_clear()
+        PATHS = resolve_paths()
+        invalidate_app_config_cache()
         return True
     except Exception as e:
         print(f"Error marking local remote as prompted: {e}")
@@ -0,0 +1,152 @@
+"""Lightweight INI reader for rclone.conf and rclone-commander.ini.
+
+Copyright (C) 2025 Miklos Mukka Szel <contact@miklos-szel.com>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import re
+from typing import Dict, Iterable, List, Optional
+from pathlib import Path
+
+# Section whose keys are defaults for every other section, as in configparser
+DEFAULT_SECTION = 'DEFAULT'
+
+# Section header, matched on a stripped line: the name runs to the last ']'
+# and anything after it is ignored, as with configparser's SECTCRE
+SECTION_RE = re.compile(r'\[(.+)\]')
+# "key = value" or "key: value" on a stripped line, split at the first delimiter
+KV_RE = re.compile(r'(.*?)\s*[=:]\s*(.*)$')
+_COMMENT_PREFIXES = ('#', ';')
+
+
+def _parse_sections(data: str) -> Dict[str, Dict[str, str]]:
+    """Parse INI text into {section: {key: value}}, DEFAULT still included.
+
+    Follows configparser's line rules: a line indented deeper than the
+    line that started the current key continues its value, blank lines
+    inside a value are kept, and full-line comments are skipped.
+    """
+    sections: Dict[str, Dict[str, List[str]]] = {}
+    current: Optional[Dict[str, List[str]]] = None  # Section being read
+    key: Optional[str] = None  # Key a deeper-indented line continues
+    indent = 0
+    for line in data.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            if key is not None:
+                current[key].append('')
+            continue
+        if stripped.startswith(_COMMENT_PREFIXES):
+            continue
+        line_indent = len(line) - len(line.lstrip())
+        if key is not None and line_indent > indent:
+            current[key].append(stripped)
+            continue
+        indent = line_indent
+        header = SECTION_RE.match(stripped)
+        if header:
+            current = sections.setdefault(header.group(1), {})
+            key = None
+        elif current is not None:
+            kv = KV_RE.match(stripped)
+            if kv and kv.group(1):
+                key = kv.group(1).lower()
+                current[key] = [kv.group(2)]
+    # Multi-line values are joined as configparser does
+    return {
+        name: {k: '\n'.join(lines).rstrip() for k, lines in values.items()}
+        for name, values in sections.items()
+    }
+
+
+def _apply_defaults(sections: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Drop the DEFAULT section, adding its keys to every section lacking them."""
+    defaults = sections.pop(DEFAULT_SECTION, None)
+    if defaults:
+        for name, values in sections.items():
+            sections[name] = {**defaults, **values}
+    return sections
+
+
+def parse_ini_text(data: str) -> Dict[str, Dict[str, str]]:
+    """Parse INI text into {section: {key: value}}.
+
+    Mirrors the configparser behaviour the app relies on: '=' and ':'
+    delimiters, lower-cased keys, stripped values, continuation lines
+    indented deeper than their key, full-line '#'/';' comments ignored,
+    header names up to the last ']', and [DEFAULT] keys applied to every
+    section instead of being a section of their own. No interpolation is
+    performed. Keys before the first section header are
+    ignored; repeated sections are merged.
+    """
+    return _apply_defaults(_parse_sections(data))
+
+
+def parse_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """Read and parse the INI file at path."""
+    return parse_ini_text(Path(path).read_text())
+
+
+def parse_ini_files(paths: Iterable[str]) -> Dict[str, Dict[str, str]]:
+    """Parse several INI files, later files overriding earlier ones per key.
+
+    As with configparser reading all of them, [DEFAULT] from any file
+    applies to sections from every file.
+    """
+    merged: Dict[str, Dict[str, str]] = {}
+    for path in paths:
+        for section, values in _parse_sections(Path(path).read_text()).items():
+            merged.setdefault(section, {}).update(values)
+    return _apply_defaults(merged)
+
+
+def set_ini_option_text(data: str, section: str, key: str, value: str) -> str:
+    """Return INI text with section.key set to value, leaving other lines as-is.
+
+    Existing occurrences of the key in the section are rewritten in place;
+    otherwise the key is inserted after the section header, and the section
+    is appended if it doesn't exist yet.
+    """
+    lines = data.splitlines(keepends=True)
+    new_line = f'{key} = {value}\n'
+    in_section = False
+    insert_at = None
+    replaced = False
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith(_COMMENT_PREFIXES):
+            continue
+        header = SECTION_RE.match(stripped)
+        if header:
+            in_section = header.group(1) == section
+            if in_section and insert_at is None:
+                insert_at = i + 1
+            continue
+        if in_section:
+            kv = KV_RE.match(stripped)
+            if kv and kv.group(1).lower() == key:
+                lines[i] = new_line
+                replaced = True
+
+    if not replaced:
+        if insert_at is not None:
+            lines.insert(insert_at, new_line)
+        else:
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+            if lines:
+                lines.append('\n')
+            lines.append(f'[{section}]\n')
+            lines.append(new_line)
+    return ''.join(lines)
@@ -18,18 +18,22 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import os
 import logging
-import threading
 import time
 import asyncio
-from typing import Optional, List, Dict, Set
+import bisect
+import codecs
+import functools
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Set, Iterable, Tuple
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, Container, Grid, Center
 from textual.widgets import Header, Footer, Static, ListView, ListItem, Label, Button, DataTable, ProgressBar, Input
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.screen import ModalScreen
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, WorkerState, get_current_worker
 from rich.text import Text
 
 from . import config
@@ -39,6 +43,37 @@ from . import progress_parser
 # Logger placeholder - will be configured after loading config
 logger = logging.getLogger(__name__)
 
+# Lazy row rendering: rows added per chunk, and how far ahead of the cursor to render
+RENDER_CHUNK = 500
+RENDER_MARGIN = 100
+
+# Background listing prefetch: how many subdirectories, and how many rclone calls at once
+PREFETCH_CHILD_DIRS = 5
+PREFETCH_CONCURRENCY = 4
+
+# Bytes stream_progress reads from rclone per call; also the most of an
+# unfinished line it keeps, so a chunk parsed is at most twice this
+STREAM_READ_SIZE = 65536
+
+# Seconds between prunes of old rclone logs (also done once at startup)
+LOG_CLEANUP_INTERVAL = 3600
+
+# rclone transfer command -> (progress title, status verb, cancel noun)
+TRANSFER_WORDING = {
+    "copy": ("Copying", "Copied", "Copy"),
+    "move": ("Moving", "Moved", "Move"),
+}
+
+
+async def run_in_thread(func, *args):
+    """Await func(*args) run in the default thread pool executor.
+
+    Same as asyncio.to_thread, which needs Python 3.9+ (we support 3.8).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
 def setup_debug_logging(enabled: bool) -> None:
     """Setup debug logging based on config or environment variable."""
     # Environment variable overrides config file
@@ -55,7 +90,7 @@ def setup_debug_logging(enabled: bool) -> None:
         logger.setLevel(logging.DEBUG)
         logger.info("=" * 80)
         logger.info("rclone-commander DEBUG MODE ENABLED")
-        logger.info(f"  Enabled by: {'environment variable' if debug_env else 'config file'}")
+        logger.info("  Enabled by: %s", 'environment variable' if debug_env else 'config file')
         logger.info("=" * 80)
     else:
         logger.addHandler(logging.NullHandler())
@@ -78,9 +113,10 @@ class FileListView(DataTable):
         Binding("right", "page_down", "Page Down", show=False),
     ]
 
-    def __init__(self, remote: str = "", rclone_path: str = "", config_path: str = "", extra_flags: str = "", local_default_path: str = "", *args, **kwargs):
+    def __init__(self, remote: str = "", rclone_path: str = "", config_path: str = "", extra_flags: str = "", local_default_path: str = "", side: str = "", *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.remote_name = remote
+        self._panel_side = side  # "left" or "right"; fixed for the widget's lifetime
         # For local remote, use configured default path (empty = home, / = root, or custom path)
         # This ensures rclone interprets paths correctly
         if remote.lower() == "local":
@@ -88,15 +124,18 @@ class FileListView(DataTable):
             if not local_default_path:
                 # Empty means home directory
                 self.current_path = os.path.expanduser("~")
-                logger.debug(f"FileListView.__init__: local remote, starting at home '{self.current_path}'")
+                logger.debug("FileListView.__init__: local remote, starting at home '%s'", self.current_path)
             else:
                 # Use configured path (could be / for root, or any other path)
                 self.current_path = local_default_path
-                logger.debug(f"FileListView.__init__: local remote, starting at configured path '{self.current_path}'")
+                logger.debug("FileListView.__init__: local remote, starting at configured path '%s'", self.current_path)
         else:
             self.current_path = ""
         self.entries: List[rclone_wrapper.FileEntry] = []
-        self.selected_items: Set[str] = set()
+        self.selected_items: Set[int] = set()  # Indices into self.entries
+        self._names_lower: List[str] = []  # Lower-cased names, parallel to self.entries
+        self._dir_count = 0  # Entries [0, _dir_count) are directories, each half sorted by _names_lower
+        self._name_to_index: Dict[str, int] = {}  # Entry name -> index into self.entries
         self._rclone_path = rclone_path
         self._config_path = config_path
         self._extra_flags = extra_flags
@@ -104,6 +143,13 @@ class FileListView(DataTable):
         self.show_header = False
         self.cursor_type = "row"
         self._last_dir_entered = ""  # Track last directory we entered
+        self._rendered_count = 0  # Entries added as table rows so far (lazy rendering)
+        self._cell_cache: List[tuple] = []  # Pre-rendered cells per rendered entry
+        self._row_offset = 0  # 1 when the ".." row is shown
+        self._load_generation = 0  # Bumped per load/display; stale listings are dropped
+        self._loading_path: Optional[str] = None  # Path of the load in flight, if any
+        self._prefetch_worker: Optional[Worker] = None  # Latest prefetch, and the
+        self._prefetch_path: Optional[str] = None  # directory it was started for
         # Add columns in __init__ so they're ready before mount
         # Name column takes most of the space, Size column gets fixed width on right
         self.add_column("Name", width=None)
@@ -113,28 +159,95 @@ class FileListView(DataTable):
         """Load initial directory listing when mounted."""
         if self._needs_initial_load and self._rclone_path:
             self._needs_initial_load = False
-            # Load data immediately in on_mount
-            entries = rclone_wrapper.list_directory(
-                self._rclone_path,
-                self._config_path,
-                self.remote_name,
-                self.current_path,
-                self._extra_flags
-            )
-            self.set_entries(entries)
+            # Both panels mount together, so their initial listings overlap
+            self._navigate_to(self.current_path)
+
+    def _navigate_to(self, path: str) -> None:
+        """Start loading path, dropping prefetches for the directory we leave."""
+        if path == self._loading_path:
+            # Already on its way (e.g. a double click); don't restart the listing
+            return
+        self.workers.cancel_group(self, "prefetch")
+        self._load_generation += 1
+        self._loading_path = path
+        self._load_dir(path, self._load_generation)
+
+    def clear_entries(self) -> None:
+        """Drop the displayed listing and selection, and any load in flight.
+
+        Used when remote_name or current_path is switched before the new
+        listing arrives: file operations act on entries, so nothing of the
+        previous location can be operated on in the meantime.
+        """
+        self.workers.cancel_group(self, "prefetch")
+        self._load_generation += 1
+        self._loading_path = None
+        self.entries = []
+        self._names_lower = []
+        self._dir_count = 0
+        self._name_to_index = {}
+        self.selected_items.clear()
+        self._rendered_count = 0
+        self._cell_cache = []
+        self._row_offset = 0
+        self.clear()
+
+    def listing_token(self) -> Tuple[str, str, int]:
+        """Identify the listing shown now, to tell later whether it was superseded."""
+        return (self.remote_name, self.current_path, self._load_generation)
+
+    def can_show_refresh(self, token: Tuple[str, str, int]) -> bool:
+        """True if a refresh started at token may still be displayed.
+
+        It may not if the remote, path or displayed listing changed since,
+        or a navigation is in flight (showing the refresh would drop it).
+        """
+        return token == self.listing_token() and self._loading_path is None
+
+    def reload(self) -> None:
+        """Re-list current_path from rclone in the background, bypassing the cache."""
+        rclone_wrapper.listing_cache.invalidate(self.remote_name, self.current_path)
+        self._loading_path = None
+        self._navigate_to(self.current_path)
+
+    @work(exclusive=True, thread=True)
+    def _load_dir(self, path: str, generation: int) -> None:
+        """List path in a worker thread, then show it on the UI thread.
+
+        current_path is only switched to path once the listing arrives, so the
+        rows on screen always match current_path. Starting a new load cancels
+        the previous one (exclusive), and a cancelled or superseded load is
+        never applied.
+        """
+        entries = rclone_wrapper.list_directory(
+            self._rclone_path,
+            self._config_path,
+            self.remote_name,
+            path,
+            self._extra_flags
+        )
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._apply_listing, path, entries, generation)
+
+    def _apply_listing(self, path: str, entries: List[rclone_wrapper.FileEntry], generation: int) -> None:
+        """Switch to path and display its entries (UI thread)."""
+        if generation != self._load_generation:
+            # A newer navigation or a direct refresh got here first
+            logger.debug("_apply_listing: dropping stale listing of '%s'", path)
+            return
+        self._loading_path = None
+        self.current_path = path
+        self.set_entries(entries)
 
     def on_focus(self) -> None:
         """Handle focus event - notify parent app which panel is active."""
-        logger.debug(f"FileListView.on_focus: {self.remote_name} panel got focus")
-        # Find the parent FilePanel and then the parent RcloneCommander app
+        logger.debug("FileListView.on_focus: %s panel got focus", self.remote_name)
+        # The panel side is fixed at construction, so no parent lookup is needed
         app = self.app
         if isinstance(app, RcloneCommander):
-            parent_panel = self.parent
-            if parent_panel == app.left_panel:
-                logger.debug(f"FileListView.on_focus: Setting active_panel to LEFT")
+            if self._panel_side == "left":
                 app.active_panel = app.left_panel
-            elif parent_panel == app.right_panel:
-                logger.debug(f"FileListView.on_focus: Setting active_panel to RIGHT")
+            elif self._panel_side == "right":
                 app.active_panel = app.right_panel
 
     def watch_current_path(self, path: str) -> None:
@@ -143,60 +256,148 @@ class FileListView(DataTable):
 
     def set_entries(self, entries: List[rclone_wrapper.FileEntry]) -> None:
         """Update the file list with new entries."""
-        logger.debug(f"set_entries: Loading {len(entries)} entries")
-        logger.debug(f"set_entries: current_path='{self.current_path}'")
-        logger.debug(f"set_entries: _last_dir_entered='{self._last_dir_entered}'")
+        logger.debug("set_entries: %d entries for '%s' (last dir '%s')",
+                     len(entries), self.current_path, self._last_dir_entered)
 
         # Sort directories first, then files - THIS ORDER MUST MATCH THE DISPLAY
-        dirs = sorted([e for e in entries if e.is_dir], key=lambda x: x.name.lower())
-        files = sorted([e for e in entries if not e.is_dir], key=lambda x: x.name.lower())
+        # Lower-case each name once, split indices in one pass, sort each half by name
+        names_lower = [e.name.lower() for e in entries]
+        dir_order: List[int] = []
+        file_order: List[int] = []
+        for i, entry in enumerate(entries):
+            (dir_order if entry.is_dir else file_order).append(i)
+        dir_order.sort(key=names_lower.__getitem__)
+        file_order.sort(key=names_lower.__getitem__)
+        order = dir_order + file_order
 
         # Store sorted entries so indices match the display
-        self.entries = dirs + files
-        logger.debug(f"set_entries: Stored {len(self.entries)} sorted entries (dirs={len(dirs)}, files={len(files)})")
+        self.entries = [entries[i] for i in order]
+        self._names_lower = [names_lower[i] for i in order]
+        self._dir_count = len(dir_order)
+        # Built in reverse so a duplicated name maps to its first occurrence
+        self._name_to_index = {self.entries[i].name: i for i in range(len(self.entries) - 1, -1, -1)}
+        dirs = self.entries[:len(dir_order)]
+        logger.debug("set_entries: dirs=%d, files=%d", len(dir_order), len(file_order))
 
         self.selected_items.clear()
 
-        # Clear existing rows
-        self.clear()
+        # Whatever is displayed now supersedes any listing still in flight
+        self._load_generation += 1
+        self._loading_path = None
+
+        # Coalesce the clear and all row additions into a single repaint
+        with self.app.batch_update():
+            # Clear existing rows
+            self._rendered_count = 0
+            self._cell_cache = []
+            self.clear()
+
+            # Add parent directory if not at root
+            # For local filesystem, root is "/"; for remotes, root is ""
+            offset = 0
+            if self.current_path and self.current_path != "/":
+                self.add_row("[cyan]..[/cyan]", "")
+                offset = 1
+
+            # Find the row for the last directory we came from
+            target_row = 0
+            if self._last_dir_entered:
+                index = self.index_of(self._last_dir_entered)
+                if index is not None:
+                    target_row = index + offset
+                self._last_dir_entered = ""  # Clear after use
+
+            # Rows are added lazily: the first chunk (and enough to reach the
+            # cursor target) now, the rest as the cursor approaches the end
+            self._row_offset = offset
+            self._rendered_count = 0
+            self._render_more(max(RENDER_CHUNK, target_row - offset + RENDER_MARGIN))
+
+            # Position cursor on target row
+            if target_row > 0 and target_row < self.row_count:
+                self.move_cursor(row=target_row)
+
+        # Warm the listing cache for the likely next navigation targets
+        if self._rclone_path:
+            prefetch_paths = [
+                join_path(self.current_path, entry.name)
+                for entry in dirs[:PREFETCH_CHILD_DIRS]
+            ]
+            if self.current_path and self.current_path != "/":
+                prefetch_paths.append(navigate_up(self.current_path))
+            worker = self._prefetch_worker
+            if (worker is not None and worker.is_running and not worker.is_cancelled
+                    and self._prefetch_path == self.current_path):
+                # A refresh of the same directory; its prefetch is still going
+                prefetch_paths = []
+            if prefetch_paths:
+                self._prefetch_path = self.current_path
+                self._prefetch_worker = self._prefetch(prefetch_paths)
+
+    @work(exclusive=True, group="prefetch")
+    async def _prefetch(self, paths: List[str]) -> None:
+        """List paths in the background to populate the listing cache.
+
+        Exclusive within the "prefetch" group, so a new listing cancels the
+        previous prefetch; cancelling kills its running rclone processes, so
+        at most PREFETCH_CONCURRENCY of them are alive per panel. Results are
+        only stored in the cache.
+        """
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
 
-        # Add parent directory if not at root
-        # For local filesystem, root is "/"; for remotes, root is ""
-        offset = 0
-        if self.current_path and self.current_path != "/":
-            self.add_row("[cyan]..[/cyan]", "")
-            logger.debug("set_entries: Added '..' row at position 0")
-            offset = 1
-
-        # Find the row for the last directory we came from
-        target_row = 0
-        if self._last_dir_entered:
-            for i, entry in enumerate(self.entries):
-                if entry.name == self._last_dir_entered:
-                    target_row = i + offset
-                    logger.debug(f"set_entries: Found last dir '{self._last_dir_entered}' at row {target_row}")
-                    break
-            self._last_dir_entered = ""  # Clear after use
+        async def prefetch_one(path: str) -> None:
+            async with semaphore:
+                await rclone_wrapper.list_directory_async(
+                    self._rclone_path,
+                    self._config_path,
+                    self.remote_name,
+                    path,
+                    self._extra_flags
+                )
 
-        row_num = offset
-        for i, entry in enumerate(self.entries):
-            if entry.is_dir:
-                name_text = f"[bold blue]{entry.name}/[/bold blue]"
-                self.add_row(name_text, "")
-                logger.debug(f"set_entries: Added dir '{entry.name}' at row {row_num} (index {i})")
-            else:
-                size = rclone_wrapper.format_size(entry.size, entry.is_dir)
-                name_text = entry.name
-                # Left-align the size column (fixed 8-char width)
-                size_text = Text(size, style="dim", justify="left")
-                self.add_row(name_text, size_text)
-                logger.debug(f"set_entries: Added file '{entry.name}' at row {row_num} (index {i})")
-            row_num += 1
-
-        # Position cursor on target row
-        if target_row > 0 and target_row < self.row_count:
-            self.move_cursor(row=target_row)
-            logger.debug(f"set_entries: Moved cursor to row {target_row}")
+        await asyncio.gather(*(prefetch_one(path) for path in paths))
+
+    def _render_more(self, count: int) -> None:
+        """Append the next count not-yet-rendered entries as table rows."""
+        start = self._rendered_count
+        end = min(len(self.entries), start + count)
+        self._cell_cache.extend(self._build_cells(entry) for entry in self.entries[start:end])
+        self.add_rows([self._row_cells(i) for i in range(start, end)])
+        self._rendered_count = end
+        if end > start:
+            logger.debug("_render_more: rendered entries %d-%d of %d", start, end, len(self.entries))
+
+    def _ensure_row_rendered(self, row: int) -> None:
+        """Make sure row, plus RENDER_MARGIN rows after it, exist in the table."""
+        needed = row - self._row_offset + RENDER_MARGIN + 1 - self._rendered_count
+        if needed > 0 and self._rendered_count < len(self.entries):
+            self._render_more(max(needed, RENDER_CHUNK))
+
+    def move_cursor(self, *, row: Optional[int] = None, **kwargs) -> None:
+        """Move the cursor, rendering lazily-added rows up to row first."""
+        if row is not None:
+            self._ensure_row_rendered(row)
+        super().move_cursor(row=row, **kwargs)
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Extend the rendered rows as the cursor nears the last one."""
+        self._ensure_row_rendered(event.cursor_row)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Extend the rendered rows as mouse-wheel or scrollbar scrolling nears the last one."""
+        super().watch_scroll_y(old_value, new_value)
+        # Rows are one line high, so this is the last row in view
+        self._ensure_row_rendered(int(new_value) + self.size.height)
+
+    def action_scroll_bottom(self) -> None:
+        """Render every remaining row before jumping to the last one."""
+        self._render_more(len(self.entries))
+        super().action_scroll_bottom()
+
+    @property
+    def total_row_count(self) -> int:
+        """Row count including entries that are not rendered yet."""
+        return self._row_offset + len(self.entries)
 
     def action_select_cursor(self) -> None:
         """Handle Enter key - navigate into directory or open file."""
@@ -204,33 +405,24 @@ class FileListView(DataTable):
 
     def action_toggle_select(self) -> None:
         """Handle Space/Insert key - toggle selection and move down."""
-        logger.debug(f"action_toggle_select: TRIGGERED at cursor_row={self.cursor_row}")
         self.toggle_selection()
         # Move to next item
         if self.cursor_row >= 0 and self.cursor_row < self.row_count - 1:
-            logger.debug(f"action_toggle_select: Moving cursor down from {self.cursor_row}")
             self.action_cursor_down()
-            logger.debug(f"action_toggle_select: Cursor now at {self.cursor_row}")
 
     def action_toggle_select_up(self) -> None:
         """Handle Shift+Up key - toggle selection and move up."""
-        logger.debug(f"action_toggle_select_up: TRIGGERED at cursor_row={self.cursor_row}")
         self.toggle_selection()
         # Move to previous item
         if self.cursor_row > 0:
-            logger.debug(f"action_toggle_select_up: Moving cursor up from {self.cursor_row}")
             self.action_cursor_up()
-            logger.debug(f"action_toggle_select_up: Cursor now at {self.cursor_row}")
 
     def action_toggle_select_down(self) -> None:
         """Handle Shift+Down key - toggle selection and move down."""
-        logger.debug(f"action_toggle_select_down: TRIGGERED at cursor_row={self.cursor_row}")
         self.toggle_selection()
         # Move to next item
         if self.cursor_row >= 0 and self.cursor_row < self.row_count - 1:
-            logger.debug(f"action_toggle_select_down: Moving cursor down from {self.cursor_row}")
             self.action_cursor_down()
-            logger.debug(f"action_toggle_select_down: Cursor now at {self.cursor_row}")
 
     def action_page_up(self) -> None:
         """Handle Left arrow - scroll up 1/2 screen."""
@@ -238,15 +430,15 @@ class FileListView(DataTable):
         page_size = max(1, self.size.height // 2)
         new_row = max(0, self.cursor_row - page_size)
         self.move_cursor(row=new_row)
-        logger.debug(f"action_page_up: Moved from row {self.cursor_row + page_size} to {new_row} (page_size={page_size})")
+        logger.debug("action_page_up: Moved from row %s to %s (page_size=%s)", self.cursor_row + page_size, new_row, page_size)
 
     def action_page_down(self) -> None:
         """Handle Right arrow - scroll down 1/2 screen."""
         # Move down half screen (or to bottom)
         page_size = max(1, self.size.height // 2)
-        new_row = min(self.row_count - 1, self.cursor_row + page_size)
+        new_row = min(self.total_row_count - 1, self.cursor_row + page_size)
         self.move_cursor(row=new_row)
-        logger.debug(f"action_page_down: Moved from row {self.cursor_row - page_size} to {new_row} (page_size={page_size})")
+        logger.debug("action_page_down: Moved from row %s to %s (page_size=%s)", self.cursor_row - page_size, new_row, page_size)
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection (Enter key or mouse click on row)."""
@@ -264,17 +456,9 @@ class FileListView(DataTable):
             dir_parts = self.current_path.rstrip('/').split('/')
             if dir_parts:
                 self._last_dir_entered = dir_parts[-1]
-                logger.debug(f"on_row_selected: Going up, will position on '{self._last_dir_entered}'")
-
-            self.current_path = navigate_up(self.current_path)
-            entries = rclone_wrapper.list_directory(
-                self._rclone_path,
-                self._config_path,
-                self.remote_name,
-                self.current_path,
-                self._extra_flags
-            )
-            self.set_entries(entries)
+                logger.debug("on_row_selected: Going up, will position on '%s'", self._last_dir_entered)
+
+            self._navigate_to(navigate_up(self.current_path))
             return
 
         # Navigate into directory
@@ -284,105 +468,102 @@ class FileListView(DataTable):
         if 0 <= actual_index < len(self.entries):
             entry = self.entries[actual_index]
             if entry.is_dir:
-                logger.debug(f"on_row_selected: Entering directory '{entry.name}'")
-                new_path = os.path.join(self.current_path, entry.name)
-                self.current_path = new_path
-                entries = rclone_wrapper.list_directory(
-                    self._rclone_path,
-                    self._config_path,
-                    self.remote_name,
-                    self.current_path,
-                    self._extra_flags
-                )
-                self.set_entries(entries)
+                logger.debug("on_row_selected: Entering directory '%s'", entry.name)
+                self._navigate_to(join_path(self.current_path, entry.name))
 
     def toggle_selection(self) -> None:
         """Toggle selection of current item."""
-        logger.debug("=" * 60)
-        logger.debug("toggle_selection: START")
-        logger.debug(f"  cursor_row: {self.cursor_row}")
-        logger.debug(f"  current_path: '{self.current_path}'")
-        logger.debug(f"  num entries: {len(self.entries)}")
-        logger.debug(f"  selected_items before: {self.selected_items}")
-
         if not self.entries or self.cursor_row < 0:
-            logger.debug("  ABORT: No entries or invalid cursor")
             return
 
         # Don't allow selection on ".." row
         # Offset is 1 if we're showing ".." (not at root)
         offset = 1 if (self.current_path and self.current_path != "/") else 0
-        logger.debug(f"  offset: {offset}")
-
-        if self.current_path and self.current_path != "/" and self.cursor_row == 0:
-            logger.debug("  ABORT: Cursor on '..' row")
+        if offset and self.cursor_row == 0:
             return
 
         actual_index = self.cursor_row - offset
-        logger.debug(f"  actual_index: {actual_index}")
-
         if actual_index < 0 or actual_index >= len(self.entries):
-            logger.debug(f"  ABORT: Index {actual_index} out of bounds [0, {len(self.entries)})")
             return
 
         entry = self.entries[actual_index]
-        logger.debug(f"  entry at index {actual_index}: '{entry.name}'")
-
-        if entry.name in self.selected_items:
-            logger.debug(f"  REMOVING selection: '{entry.name}'")
-            self.selected_items.remove(entry.name)
+        if actual_index in self.selected_items:
+            self.selected_items.remove(actual_index)
         else:
-            logger.debug(f"  ADDING selection: '{entry.name}'")
-            self.selected_items.add(entry.name)
-
-        logger.debug(f"  selected_items after: {self.selected_items}")
+            self.selected_items.add(actual_index)
+        logger.debug("toggle_selection: row %d '%s' selected=%s (%d selected)",
+                     self.cursor_row, entry.name, actual_index in self.selected_items, len(self.selected_items))
 
-        # Refresh the entire table to ensure markers are in sync
-        logger.debug("  Calling _refresh_all_items()")
-        self._refresh_all_items()
-        logger.debug("toggle_selection: END")
-        logger.debug("=" * 60)
+        # Only this row's highlight changed
+        self._refresh_item_display(self.cursor_row, entry)
 
     def _refresh_all_items(self) -> None:
-        """Refresh all items to update selection markers."""
-        offset = 1 if self.current_path else 0
-        logger.debug(f"_refresh_all_items: offset={offset}, entries={len(self.entries)}")
+        """Refresh all rendered items to update selection markers (full re-render)."""
+        offset = 1 if (self.current_path and self.current_path != "/") else 0
+        logger.debug("_refresh_all_items: offset=%d, rows=%d", offset, self._rendered_count)
 
-        for i, entry in enumerate(self.entries):
-            row_index = i + offset
-            logger.debug(f"  Refreshing row {row_index}: '{entry.name}' (selected={entry.name in self.selected_items})")
-            self._refresh_item_display(row_index, entry)
+        with self.app.batch_update():
+            for i, entry in enumerate(self.entries[:self._rendered_count]):
+                self._refresh_item_display(i + offset, entry)
 
-    def _refresh_item_display(self, row_index: int, entry: rclone_wrapper.FileEntry) -> None:
-        """Refresh the display of a single item."""
-        is_selected = entry.name in self.selected_items
+    @staticmethod
+    def _build_cells(entry: rclone_wrapper.FileEntry) -> tuple:
+        """Pre-render (name, selected name, size) cells for entry.
 
+        Built once per rendered entry and reused by every selection toggle.
+        """
         # Use inverted colors for selected items instead of a marker
         if entry.is_dir:
-            if is_selected:
-                name = f"[black on blue]{entry.name}/[/black on blue]"
-            else:
-                name = f"[bold blue]{entry.name}/[/bold blue]"
-            size = ""
-        else:
-            size_str = rclone_wrapper.format_size(entry.size, entry.is_dir)
-            if is_selected:
-                name = f"[black on white]{entry.name}[/black on white]"
-            else:
-                name = entry.name
+            return (
+                f"[bold blue]{entry.name}/[/bold blue]",
+                f"[black on blue]{entry.name}/[/black on blue]",
+                "",
+            )
+        size_str = rclone_wrapper.format_size(entry.size, entry.is_dir)
+        return (
+            entry.name,
+            f"[black on white]{entry.name}[/black on white]",
             # Left-align the size column (fixed 8-char width)
-            size = Text(size_str, style="dim", justify="left")
+            Text(size_str, style="dim", justify="left"),
+        )
 
-        logger.debug(f"_refresh_item_display: row={row_index}, name='{entry.name}', selected={'YES' if is_selected else 'NO'}")
+    def _row_cells(self, index: int) -> tuple:
+        """Get the (name, size) cells for entry index, reflecting its selection."""
+        name, selected_name, size = self._cell_cache[index]
+        if index in self.selected_items:
+            return selected_name, size
+        return name, size
 
-        # Update the row
+    def _refresh_item_display(self, row_index: int, entry: rclone_wrapper.FileEntry) -> None:
+        """Refresh the display of a single item."""
+        # Selection only changes the name cell; the size cell is reused as-is
+        name, _ = self._row_cells(row_index - self._row_offset)
         self.update_cell_at((row_index, 0), name)
-        self.update_cell_at((row_index, 1), size)
+
+    def index_of(self, name: str) -> Optional[int]:
+        """Return the index into self.entries of the entry called name, if any."""
+        return self._name_to_index.get(name)
+
+    def find_prefix(self, prefix: str) -> Optional[int]:
+        """Return the index of the first entry whose name starts with prefix.
+
+        Case-insensitive; "first" is in display order (directories, then
+        files). Each half is sorted by lower-cased name, so this is a binary
+        search per half instead of a scan.
+        """
+        prefix = prefix.lower()
+        names = self._names_lower
+        for lo, hi in ((0, self._dir_count), (self._dir_count, len(names))):
+            i = bisect.bisect_left(names, prefix, lo, hi)
+            if i < hi and names[i].startswith(prefix):
+                return i
+        return None
 
     def get_selected_entries(self) -> List[rclone_wrapper.FileEntry]:
         """Get all selected entries, or current entry if none selected."""
         if self.selected_items:
-            return [e for e in self.entries if e.name in self.selected_items]
+            # Sorted so entries come back in display order
+            return [self.entries[i] for i in sorted(self.selected_items)]
 
         # If nothing selected, return current entry
         if not self.entries or self.cursor_row < 0:
@@ -400,7 +581,7 @@ class FileListView(DataTable):
 class FilePanel(Vertical):
     """A panel containing file list and path display."""
 
-    def __init__(self, remote: str = "", rclone_path: str = "", config_path: str = "", extra_flags: str = "", local_default_path: str = "", *args, **kwargs):
+    def __init__(self, remote: str = "", rclone_path: str = "", config_path: str = "", extra_flags: str = "", local_default_path: str = "", side: str = "", *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.remote = remote
         self.file_list: Optional[FileListView] = None
@@ -408,6 +589,7 @@ class FilePanel(Vertical):
         self._config_path = config_path
         self._extra_flags = extra_flags
         self._local_default_path = local_default_path
+        self._side = side
 
     def compose(self) -> ComposeResult:
         """Compose the file panel."""
@@ -416,7 +598,8 @@ class FilePanel(Vertical):
             rclone_path=self._rclone_path,
             config_path=self._config_path,
             extra_flags=self._extra_flags,
-            local_default_path=self._local_default_path
+            local_default_path=self._local_default_path,
+            side=self._side
         )
         yield self.file_list
 
@@ -466,9 +649,10 @@ class RemoteSelectionScreen(ModalScreen):
         Binding("q", "dismiss", "Cancel"),
     ]
 
-    def __init__(self, remotes: List[str], current_remote: str):
+    def __init__(self, remotes: Iterable[str], current_remote: str):
         super().__init__()
-        self.remotes = ["local"] + remotes  # Add local as an option
+        # Add local as an option (once, even if rclone.conf also defines it)
+        self.remotes = ["local", *(r for r in remotes if r != "local")]
         self.current_remote = current_remote
 
     def compose(self) -> ComposeResult:
@@ -482,9 +666,17 @@ class RemoteSelectionScreen(ModalScreen):
     def on_mount(self) -> None:
         """Populate the list after mounting."""
         remote_list = self.query_one("#remote-list", ListView)
-        for remote in self.remotes:
-            marker = "[green]►[/green] " if remote == self.current_remote else "  "
-            remote_list.append(ListItem(Label(f"{marker}{remote}")))
+        # Mount all rows in one call instead of one append (and refresh) per remote
+        remote_list.extend(ListItem(Label(self._remote_label(remote))) for remote in self.remotes)
+
+    def _remote_label(self, remote: str) -> str:
+        """Return the list label for a remote.
+
+        Kept free of UI state so per-remote metadata (health, quota) can later
+        be computed for all remotes in parallel off the event loop.
+        """
+        marker = "[green]►[/green] " if remote == self.current_remote else "  "
+        return f"{marker}{remote}"
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Handle remote selection."""
@@ -606,11 +798,17 @@ class ProgressModal(ModalScreen):
         self.operation = operation  # "Copying", "Moving", "Deleting"
         self.total_files = total_files
         self.current_file_num = 0
+        self.current_last_num = 0  # Last file number of the running batch (== current_file_num for one file)
         self.current_filename = ""
         self.process = None  # Will be set by the operation
-        self.stop_event = None  # Will be set by the operation
         self.cancelled = False
         self.current_dst_path = None  # Track destination for cleanup
+        # Per-file progress widgets keyed by filename: (item, name, bar, stats)
+        self._file_rows: Dict[str, tuple] = {}
+        # Newest (progress_data, file_num) from the log monitor, applied by _flush_progress
+        self._pending_progress: Optional[tuple] = None
+        # Text last shown by each Static, so repeated stats lines skip the re-render
+        self._last_rendered: Dict[Static, str] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the modal dialog."""
@@ -632,16 +830,49 @@ class ProgressModal(ModalScreen):
             with Container(id="cancel-button-container"):
                 yield Button("Cancel (Esc)", variant="error", id="cancel-button")
 
-    def update_progress(self, filename: str, file_num: int) -> None:
+    def on_mount(self) -> None:
+        """Start applying coalesced progress updates (at most 10 per second)."""
+        self.set_interval(0.1, self._flush_progress)
+
+    def post_progress(self, progress_data, file_num: int) -> None:
+        """Hand over parsed progress data; safe to call from any thread.
+
+        Only the newest update is kept, so several stats blocks arriving
+        between two flushes cost a single redraw.
+        """
+        self._pending_progress = (progress_data, file_num)
+
+    def _flush_progress(self) -> None:
+        """Apply the newest pending progress update, if any."""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            self.update_from_progress_data(*pending)
+
+    def _set_text(self, widget: Static, text: str) -> None:
+        """Update widget with text unless it already shows exactly that."""
+        if self._last_rendered.get(widget) != text:
+            self._last_rendered[widget] = text
+            widget.update(text)
+
+    def _file_counter(self, file_num: int) -> str:
+        """Counter text: "File X of N", or "Files X-Y of N" while a batch runs."""
+        if self.current_last_num > file_num:
+            return f"Files {file_num}-{self.current_last_num} of {self.total_files}"
+        return f"File {file_num} of {self.total_files}"
+
+    def update_progress(self, filename: str, file_num: int, last_num: Optional[int] = None) -> None:
         """Update the progress display (basic mode - for backward compatibility).
 
         This is used when detailed rclone progress data is not yet available.
+        For a batch of files run together, file_num and last_num are the
+        first and last of their numbers.
         """
         self.current_filename = filename
         self.current_file_num = file_num
+        self.current_last_num = file_num if last_num is None else last_num
 
         # Update file counter
-        self.query_one("#progress-counter", Static).update(f"File {file_num} of {self.total_files}")
+        self._set_text(self.query_one("#progress-counter", Static), self._file_counter(file_num))
 
         # Don't update overall progress bar here - let rclone stats handle it
         # This prevents showing 100% when starting a single file transfer
@@ -649,6 +880,9 @@ class ProgressModal(ModalScreen):
         # Show a simple file progress in the container
         container = self.query_one("#file-progress-container", Vertical)
         container.remove_children()
+        for row in self._file_rows.values():
+            self._last_rendered.pop(row[3], None)
+        self._file_rows.clear()
 
         # Add a simple file name display
         file_container = Vertical(classes="file-progress-item")
@@ -682,53 +916,56 @@ class ProgressModal(ModalScreen):
 
         if overall_stats_parts:
             overall_stats = " | ".join(overall_stats_parts)
-            self.query_one("#progress-overall-stats", Static).update(overall_stats)
+            self._set_text(self.query_one("#progress-overall-stats", Static), overall_stats)
 
         # Update file counter
-        counter_text = f"File {file_num} of {self.total_files}"
+        counter_text = self._file_counter(file_num)
         if progress_data.files_transferred > 0:
             counter_text = f"{progress_data.files_transferred} / {progress_data.total_files} files completed"
-        self.query_one("#progress-counter", Static).update(counter_text)
+        self._set_text(self.query_one("#progress-counter", Static), counter_text)
 
-        # Update individual file progress bars
+        # Update individual file progress bars in place; only files that
+        # started or finished since the last tick mount or remove widgets
         container = self.query_one("#file-progress-container", Vertical)
-
-        # Clear existing widgets
-        container.remove_children()
-
-        # Add progress widgets for each transferring file
-        if progress_data.transferring_files:
-            for file_prog in progress_data.transferring_files:
-                # Create a container for this file's progress
-                file_container = Vertical(classes="file-progress-item")
-
-                # Mount the container first
-                container.mount(file_container)
-
-                # File name
-                file_name = Static(f"[cyan]{file_prog.filename}[/cyan]", classes="file-progress-name")
-                file_container.mount(file_name)
-
-                # Progress bar
+        current = {file_prog.filename: file_prog for file_prog in progress_data.transferring_files}
+
+        if not self._file_rows and container.children:
+            # Drop the basic-mode placeholder left by update_progress
+            container.remove_children()
+
+        for filename in [name for name in self._file_rows if name not in current]:
+            row = self._file_rows.pop(filename)
+            self._last_rendered.pop(row[3], None)
+            row[0].remove()
+
+        for filename, file_prog in current.items():
+            row = self._file_rows.get(filename)
+            if row is None:
+                # File name, progress bar and stats line, mounted together
+                file_name = Static(f"[cyan]{filename}[/cyan]", classes="file-progress-name")
                 progress_bar = ProgressBar(total=100, show_eta=False, classes="file-progress-bar")
-                progress_bar.update(progress=file_prog.percentage)
-                file_container.mount(progress_bar)
-
-                # Stats line
-                stats_parts = []
-                if file_prog.percentage > 0:
-                    stats_parts.append(f"{file_prog.percentage}%")
-                if file_prog.size:
-                    stats_parts.append(f"Size: {file_prog.size}")
-                if file_prog.speed:
-                    stats_parts.append(f"Speed: {file_prog.speed}")
-                if file_prog.eta:
-                    stats_parts.append(f"ETA: {file_prog.eta}")
-
-                if stats_parts:
-                    stats_text = " | ".join(stats_parts)
-                    stats_widget = Static(stats_text, classes="file-progress-stats")
-                    file_container.mount(stats_widget)
+                stats_widget = Static("", classes="file-progress-stats")
+                file_container = Vertical(file_name, progress_bar, stats_widget, classes="file-progress-item")
+                row = (file_container, file_name, progress_bar, stats_widget)
+                self._file_rows[filename] = row
+                container.mount(file_container)
+            _, _, progress_bar, stats_widget = row
+            progress_bar.update(progress=file_prog.percentage)
+
+            # Stats line
+            stats_parts = []
+            if file_prog.percentage > 0:
+                stats_parts.append(f"{file_prog.percentage}%")
+            if file_prog.size:
+                stats_parts.append(f"Size: {file_prog.size}")
+            if file_prog.speed:
+                stats_parts.append(f"Speed: {file_prog.speed}")
+            if file_prog.eta:
+                stats_parts.append(f"ETA: {file_prog.eta}")
+
+            stats_text = " | ".join(stats_parts)
+            self._set_text(stats_widget, stats_text)
+            stats_widget.display = bool(stats_text)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle cancel button press."""
@@ -746,11 +983,7 @@ class ProgressModal(ModalScreen):
                 self.process.kill()
                 logger.debug("ProgressModal: Killed rclone process")
             except Exception as e:
-                logger.error(f"ProgressModal: Failed to kill process: {e}")
-
-        # Signal the monitor thread to stop
-        if self.stop_event:
-            self.stop_event.set()
+                logger.error("ProgressModal: Failed to kill process: %s", e)
 
         # Update UI
         self.query_one("#progress-title", Static).update(f"{self.operation} - CANCELLED")
@@ -758,7 +991,7 @@ class ProgressModal(ModalScreen):
 
     def update_status_text(self, message: str) -> None:
         """Update a status message in the modal."""
-        self.query_one("#progress-overall-stats", Static).update(f"[red]{message}[/red]")
+        self._set_text(self.query_one("#progress-overall-stats", Static), f"[red]{message}[/red]")
 
 
 class ConfirmationModal(ModalScreen[bool]):
@@ -824,24 +1057,23 @@ class ConfirmationModal(ModalScreen[bool]):
         self.num_dirs = num_dirs
         self.total_size = total_size
 
-    def compose(self) -> ComposeResult:
-        """Compose the modal dialog."""
-        # Format the details message
+        # Format the details message once; compose may run more than once
         items = []
-        if self.num_files > 0:
-            items.append(f"{self.num_files} file{'s' if self.num_files != 1 else ''}")
-        if self.num_dirs > 0:
-            items.append(f"{self.num_dirs} director{'ies' if self.num_dirs != 1 else 'y'}")
-
-        items_str = " and ".join(items)
+        if num_files > 0:
+            items.append(f"{num_files} file{'s' if num_files != 1 else ''}")
+        if num_dirs > 0:
+            items.append(f"{num_dirs} director{'ies' if num_dirs != 1 else 'y'}")
+        self._message = f"[bold]{operation} {' and '.join(items)}?[/bold]"
+        # Only show size if it's greater than 0
+        self._size_str = rclone_wrapper.format_size(total_size) if total_size > 0 else ""
 
+    def compose(self) -> ComposeResult:
+        """Compose the modal dialog."""
         with Container(id="confirm-dialog"):
             yield Static(f"Confirm {self.operation}", id="confirm-title")
-            yield Static(f"[bold]{self.operation} {items_str}?[/bold]", id="confirm-message")
-            # Only show size if it's greater than 0
-            if self.total_size > 0:
-                size_str = rclone_wrapper.format_size(self.total_size)
-                yield Static(f"Total size: {size_str}", id="confirm-details")
+            yield Static(self._message, id="confirm-message")
+            if self._size_str:
+                yield Static(f"Total size: {self._size_str}", id="confirm-details")
             with Horizontal(id="confirm-buttons"):
                 yield Button("Yes", variant="primary", id="yes-button")
                 yield Button("Cancel", variant="default", id="cancel-button")
@@ -989,16 +1221,15 @@ class DirectorySizeModal(ModalScreen):
         self.dir_name = dir_name
         self.file_count = file_count
         self.total_size = total_size
+        self._size_str = rclone_wrapper.format_size(total_size)
 
     def compose(self) -> ComposeResult:
         """Compose the modal dialog."""
-        size_str = rclone_wrapper.format_size(self.total_size)
-
         with Container(id="dirsize-dialog"):
             yield Static("Directory Size", id="dirsize-title")
             yield Static(f"[bold]{self.dir_name}[/bold]", id="dirsize-name")
             yield Static(f"Files: {self.file_count}", id="dirsize-files")
-            yield Static(f"Total Size: {size_str}", id="dirsize-size")
+            yield Static(f"Total Size: {self._size_str}", id="dirsize-size")
             yield Static("Press Enter or Esc to close", id="dirsize-instructions")
 
     def action_dismiss_modal(self) -> None:
@@ -1121,54 +1352,58 @@ class MakeDirectoryModal(ModalScreen[str]):
         self.dismiss(None)
 
 
-def monitor_progress_log(app: App, log_path: str, progress_modal: ProgressModal, file_num: int, stop_event: threading.Event) -> None:
-    """Monitor rclone log file and update progress modal in background thread.
+async def stream_progress(stream: asyncio.StreamReader, log_path: Optional[str], progress_modal: ProgressModal, file_num: int) -> None:
+    """Read rclone's log output until EOF, updating the progress modal.
+
+    Runs on the event loop: each read returns as soon as rclone writes
+    something, so there is no polling. Only complete lines are parsed, so a
+    stats block is never seen half-written. The output is also saved to
+    log_path, as rclone's own --log-file used to be; each chunk is written
+    in a thread while the next one is read and parsed.
 
     Args:
-        app: The Textual app instance (for call_from_thread)
-        log_path: Path to the rclone log file
+        stream: rclone's stderr (where it logs, stats included)
+        log_path: Path to save the log to, or None to keep it in memory only
         progress_modal: The ProgressModal to update
         file_num: Current file number (1-indexed)
-        stop_event: Threading event to signal when to stop monitoring
     """
-    last_position = 0
-    wait_count = 0
-    max_wait = 10  # Wait up to 10 seconds for log file to appear
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    partial = ""
 
-    logger.debug(f"monitor_progress_log: Starting monitor for {log_path}")
+    logger.debug("stream_progress: Streaming rclone output to %s", log_path)
 
-    while not stop_event.is_set():
-        try:
-            # Read new content from log file
-            new_content, last_position = progress_parser.tail_log_file(log_path, last_position)
+    # Log write still running in a thread, if any; one at a time keeps them in order
+    write: Optional[asyncio.Future] = None
 
-            if new_content:
-                # Reset wait counter if we got data
-                wait_count = 0
+    with open(log_path, "wb") if log_path else nullcontext() as log_file:
+        try:
+            while True:
+                chunk = await stream.read(STREAM_READ_SIZE)
+                if not chunk:
+                    break
+                if log_file is not None:
+                    if write is not None:
+                        await write
+                    write = asyncio.ensure_future(run_in_thread(log_file.write, chunk))
+
+                content = partial + decoder.decode(chunk)
+                end = content.rfind("\n") + 1
+                # A line this long is no stats line; only its tail could matter
+                partial = content[end:][-STREAM_READ_SIZE:]
+                if not end:
+                    continue
 
                 # Parse the progress data
-                progress_data = progress_parser.parse_log_content(new_content)
-
+                progress_data = progress_parser.parse_log_content(content[:end])
                 if progress_data:
-                    # Update the modal from the main thread
-                    app.call_from_thread(progress_modal.update_from_progress_data, progress_data, file_num)
-                    app.call_from_thread(app.refresh)
-            else:
-                # No new content - check if we should keep waiting
-                wait_count += 1
-                if wait_count > max_wait and last_position == 0:
-                    # Log file hasn't appeared yet after max_wait seconds
-                    logger.warning(f"monitor_progress_log: Log file {log_path} not found after {max_wait}s")
-                    break
-
-            # Sleep briefly before next check
-            time.sleep(0.5)
-
-        except Exception as e:
-            logger.error(f"monitor_progress_log: Error reading log: {e}")
-            time.sleep(1)  # Wait longer on error
+                    # The modal applies the newest update on its own timer
+                    progress_modal.post_progress(progress_data, file_num)
+        finally:
+            # Don't close the file under a write that is still running
+            if write is not None:
+                await write
 
-    logger.debug(f"monitor_progress_log: Stopped monitor for {log_path}")
+    logger.debug("stream_progress: rclone output ended for %s", log_path)
 
 
 class RcloneCommander(App):
@@ -1204,10 +1439,14 @@ class RcloneCommander(App):
 
     def __init__(self):
         super().__init__()
-        self.config_path = config.get_config_path()
-        self.rclone_path = config.get_rclone_path()
+        self.config_path = config.PATHS.rclone_conf
+        self.rclone_path = config.PATHS.rclone
         self.remotes = config.load_remotes(self.config_path)
+        # Remote names snapshot; rclone.conf is only re-read when [local] is added
+        self._remote_names: Tuple[str, ...] = tuple(config.get_remote_names(self.remotes))
         self.app_config = config.load_app_config()
+        # {key: action} for the configured bindings, resolved once
+        self._key_to_action = config.get_keybindings_map(self.app_config)
 
         # Setup debug logging based on config
         setup_debug_logging(self.app_config.debug)
@@ -1216,24 +1455,26 @@ class RcloneCommander(App):
         # Setting self.BINDINGS here doesn't work properly with Textual
 
         # Log all configured bindings (these will be registered in on_mount)
-        logger.debug("=" * 80)
-        logger.debug("KEY BINDINGS CONFIGURED:")
-        logger.debug(f"  Copy:   {self.app_config.key_copy} -> action_copy")
-        logger.debug(f"  Move:   {self.app_config.key_move} -> action_move")
-        logger.debug(f"  Delete: {self.app_config.key_delete} -> action_delete")
-        logger.debug(f"  Remote: {self.app_config.key_select_remote} -> action_select_remote")
-        logger.debug(f"  Switch: {self.app_config.key_switch_panel} -> action_switch_panel")
-        logger.debug(f"  Swap:   {self.app_config.key_swap_panels} -> action_swap_panels")
-        logger.debug(f"  Quit:   {self.app_config.key_quit} -> quit")
-        logger.debug("=" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=" * 80)
+            logger.debug("KEY BINDINGS CONFIGURED:")
+            for label, keys, action in (
+                ("Copy:  ", self.app_config.key_copy, "action_copy"),
+                ("Move:  ", self.app_config.key_move, "action_move"),
+                ("Delete:", self.app_config.key_delete, "action_delete"),
+                ("Remote:", self.app_config.key_select_remote, "action_select_remote"),
+                ("Switch:", self.app_config.key_switch_panel, "action_switch_panel"),
+                ("Swap:  ", self.app_config.key_swap_panels, "action_swap_panels"),
+                ("Quit:  ", self.app_config.key_quit, "quit"),
+            ):
+                logger.debug("  %s %s -> %s", label, ",".join(keys), action)
+            logger.debug("=" * 80)
 
         self.left_panel: Optional[FilePanel] = None
         self.right_panel: Optional[FilePanel] = None
         self.active_panel: Optional[FilePanel] = None
 
         # Set default remotes from app config
-        remote_names = config.get_remote_names(self.remotes)
-
         # Left panel: use config default, or local
         # "local" is always valid even if not in rclone.conf
         self.left_remote = self.app_config.default_left_remote if self.app_config.default_left_remote else "local"
@@ -1241,8 +1482,8 @@ class RcloneCommander(App):
         # Right panel: use config default, or first available remote from rclone.conf, or local
         if self.app_config.default_right_remote:
             self.right_remote = self.app_config.default_right_remote
-        elif remote_names:
-            self.right_remote = remote_names[0]
+        elif self._remote_names:
+            self.right_remote = self._remote_names[0]
         else:
             self.right_remote = "local"
 
@@ -1257,6 +1498,7 @@ class RcloneCommander(App):
                 config_path=self.config_path,
                 extra_flags=self.app_config.extra_rclone_flags,
                 local_default_path=self.app_config.local_default_path,
+                side="left",
                 id="left-panel"
             )
             yield self.left_panel
@@ -1267,6 +1509,7 @@ class RcloneCommander(App):
                 config_path=self.config_path,
                 extra_flags=self.app_config.extra_rclone_flags,
                 local_default_path=self.app_config.local_default_path,
+                side="right",
                 id="right-panel"
             )
             yield self.right_panel
@@ -1283,38 +1526,22 @@ class RcloneCommander(App):
         logger.debug("=" * 80)
         logger.debug("REGISTERING DYNAMIC BINDINGS:")
 
-        self.bind(self.app_config.key_quit, "quit", description=self.app_config.label_quit)
-        logger.debug(f"  Registered: {self.app_config.key_quit} -> quit")
-
-        self.bind(self.app_config.key_switch_panel, "switch_panel", description=self.app_config.label_switch)
-        logger.debug(f"  Registered: {self.app_config.key_switch_panel} -> switch_panel")
-
-        self.bind(self.app_config.key_swap_panels, "swap_panels", description="Swap Panels")
-        logger.debug(f"  Registered: {self.app_config.key_swap_panels} -> swap_panels")
-
-        self.bind(self.app_config.key_copy, "copy", description=self.app_config.label_copy)
-        logger.debug(f"  Registered: {self.app_config.key_copy} -> copy")
-
-        self.bind(self.app_config.key_move, "move", description=self.app_config.label_move)
-        logger.debug(f"  Registered: {self.app_config.key_move} -> move")
-
-        self.bind(self.app_config.key_make_directory, "make_directory", description="Make Dir")
-        logger.debug(f"  Registered: {self.app_config.key_make_directory} -> make_directory")
-
-        self.bind(self.app_config.key_delete, "delete", description=self.app_config.label_delete)
-        logger.debug(f"  Registered: {self.app_config.key_delete} -> delete")
-
-        self.bind(self.app_config.key_select_remote, "select_remote", description=self.app_config.label_remotes)
-        logger.debug(f"  Registered: {self.app_config.key_select_remote} -> select_remote")
-
-        self.bind(self.app_config.key_refresh_panel, "refresh_panel", description="Refresh")
-        logger.debug(f"  Registered: {self.app_config.key_refresh_panel} -> refresh_panel")
-
-        self.bind("slash", "quick_search", description="Search")
-        logger.debug(f"  Registered: slash (/) -> quick_search")
-
-        self.bind(self.app_config.key_show_dir_size, "show_dir_size", description="Dir Size")
-        logger.debug(f"  Registered: {self.app_config.key_show_dir_size} -> show_dir_size")
+        cfg = self.app_config
+        for key, action, description in (
+            (",".join(cfg.key_quit), "quit", cfg.label_quit),
+            (",".join(cfg.key_switch_panel), "switch_panel", cfg.label_switch),
+            (",".join(cfg.key_swap_panels), "swap_panels", "Swap Panels"),
+            (",".join(cfg.key_copy), "copy", cfg.label_copy),
+            (",".join(cfg.key_move), "move", cfg.label_move),
+            (",".join(cfg.key_make_directory), "make_directory", "Make Dir"),
+            (",".join(cfg.key_delete), "delete", cfg.label_delete),
+            (",".join(cfg.key_select_remote), "select_remote", cfg.label_remotes),
+            (",".join(cfg.key_refresh_panel), "refresh_panel", "Refresh"),
+            ("slash", "quick_search", "Search"),
+            (",".join(cfg.key_show_dir_size), "show_dir_size", "Dir Size"),
+        ):
+            self.bind(key, action, description=description)
+            logger.debug("  Registered: %s -> %s", key, action)
 
         logger.debug("=" * 80)
 
@@ -1326,6 +1553,15 @@ class RcloneCommander(App):
         # Check if [local] remote is missing and prompt user (first run only)
         self.check_local_remote()
 
+        # Prune old rclone logs now and periodically, not before every transfer
+        self._cleanup_logs()
+        self.set_interval(LOG_CLEANUP_INTERVAL, self._cleanup_logs)
+
+    @work(thread=True, exclusive=True, group="log_cleanup")
+    def _cleanup_logs(self) -> None:
+        """Keep only the newest progress_log_retention rclone logs (worker thread)."""
+        rclone_wrapper.cleanup_old_logs("logs", self.app_config.progress_log_retention)
+
     def check_local_remote(self) -> None:
         """Check if [local] remote exists and prompt user to add it if missing.
 
@@ -1333,8 +1569,8 @@ class RcloneCommander(App):
         """
         # Only prompt if we haven't asked before
         if not self.app_config.local_remote_prompted:
-            # Check if [local] remote exists
-            if not config.has_local_remote(self.config_path):
+            # Check if [local] remote exists (self.remotes is the cached rclone.conf parse)
+            if "local" not in self.remotes:
                 # Show modal to ask user
                 async def handle_local_remote_response(add_local: Optional[bool]) -> None:
                     """Handle user's response to add [local] remote."""
@@ -1344,16 +1580,18 @@ class RcloneCommander(App):
                         if success:
                             # Reload remotes
                             self.remotes = config.load_remotes(self.config_path)
+                            self._remote_names = tuple(config.get_remote_names(self.remotes))
                             logger.debug("[local] remote successfully added to rclone.conf")
                             self.notify("Local remote added successfully!", severity="information")
 
                             # Refresh any panels using "local" remote
-                            if self.left_panel and self.left_panel.remote.lower() == "local":
-                                logger.debug("Refreshing left panel after [local] remote added")
-                                refresh_panel(self.left_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-                            if self.right_panel and self.right_panel.remote.lower() == "local":
-                                logger.debug("Refreshing right panel after [local] remote added")
-                                refresh_panel(self.right_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+                            local_panels = [panel for panel in (self.left_panel, self.right_panel)
+                                            if panel and panel.remote.lower() == "local"]
+                            logger.debug("Refreshing %d panel(s) after [local] remote added", len(local_panels))
+                            await asyncio.gather(*(
+                                refresh_panel_async(panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+                                for panel in local_panels
+                            ))
                         else:
                             logger.warning("Failed to add [local] remote")
                             self.notify("Failed to add local remote. You may need to add it manually.", severity="warning")
@@ -1368,44 +1606,20 @@ class RcloneCommander(App):
 
     def on_key(self, event) -> None:
         """Log all key presses for debugging."""
-        from textual.events import Key
+        # Purely observability: skip all formatting unless debug logging is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
 
         logger.debug("=" * 80)
-        logger.debug(f"🔑 KEY EVENT DETECTED:")
-        logger.debug(f"  event.key = '{event.key}'")
-        logger.debug(f"  type(event.key) = {type(event.key)}")
-
-        if hasattr(event, 'character'):
-            logger.debug(f"  event.character = '{event.character}'")
-        if hasattr(event, 'is_printable'):
-            logger.debug(f"  event.is_printable = {event.is_printable}")
-        if hasattr(event, 'name'):
-            logger.debug(f"  event.name = '{event.name}'")
-
-        logger.debug("")
-        logger.debug("📋 CONFIGURED BINDINGS:")
-
-        # Check which action this should trigger
-        bindings_map = {
-            self.app_config.key_copy: "copy",
-            self.app_config.key_move: "move",
-            self.app_config.key_delete: "delete",
-            self.app_config.key_select_remote: "select_remote",
-            self.app_config.key_quit: "quit",
-            self.app_config.key_switch_panel: "switch_panel",
-            self.app_config.key_swap_panels: "swap_panels"
-        }
-
-        for key_binding, action_name in bindings_map.items():
-            logger.debug(f"  {action_name:20s} -> {key_binding}")
-            # Split on comma and strip whitespace
-            binding_keys = [k.strip() for k in key_binding.split(',')]
-            for binding_key in binding_keys:
-                if event.key == binding_key:
-                    logger.debug(f"    ✓✓✓ EXACT MATCH: '{event.key}' == '{binding_key}'")
-                    logger.debug(f"    >>> Should trigger action_{action_name}()")
-                else:
-                    logger.debug(f"    ✗ No match: '{event.key}' != '{binding_key}'")
+        logger.debug("🔑 KEY EVENT: key=%r character=%r is_printable=%s name=%r",
+                     event.key, event.character, event.is_printable, event.name)
+
+        # Resolve the configured action with a single dict lookup
+        action_name = self._key_to_action.get(event.key)
+        if action_name:
+            logger.debug("  ✓ '%s' >>> action_%s()", event.key, action_name)
+        else:
+            logger.debug("  ✗ No configured binding for '%s'", event.key)
 
         logger.debug("=" * 80)
 
@@ -1433,9 +1647,9 @@ class RcloneCommander(App):
             logger.debug("action_swap_panels: Missing file_list in panels")
             return
 
-        logger.debug(f"  Before swap:")
-        logger.debug(f"    left: {self.left_panel.remote}:{self.left_panel.file_list.current_path}")
-        logger.debug(f"    right: {self.right_panel.remote}:{self.right_panel.file_list.current_path}")
+        logger.debug("  Before swap:")
+        logger.debug("    left: %s:%s", self.left_panel.remote, self.left_panel.file_list.current_path)
+        logger.debug("    right: %s:%s", self.right_panel.remote, self.right_panel.file_list.current_path)
 
         # Swap remote names
         temp_remote = self.left_panel.remote
@@ -1452,13 +1666,17 @@ class RcloneCommander(App):
         self.left_panel.file_list.current_path = self.right_panel.file_list.current_path
         self.right_panel.file_list.current_path = temp_path
 
-        logger.debug(f"  After swap:")
-        logger.debug(f"    left: {self.left_panel.remote}:{self.left_panel.file_list.current_path}")
-        logger.debug(f"    right: {self.right_panel.remote}:{self.right_panel.file_list.current_path}")
+        logger.debug("  After swap:")
+        logger.debug("    left: %s:%s", self.left_panel.remote, self.left_panel.file_list.current_path)
+        logger.debug("    right: %s:%s", self.right_panel.remote, self.right_panel.file_list.current_path)
 
-        # Refresh both panels
-        refresh_panel(self.left_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-        refresh_panel(self.right_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+        # The rows still belong to the other side until the new listings land
+        self.left_panel.file_list.clear_entries()
+        self.right_panel.file_list.clear_entries()
+
+        # Re-list both panels; each loads in its own worker, so the two rclone calls overlap
+        self.left_panel.file_list.reload()
+        self.right_panel.file_list.reload()
 
         self.update_status("Panels swapped")
         logger.debug("action_swap_panels: END")
@@ -1478,31 +1696,28 @@ class RcloneCommander(App):
         src_panel = self.active_panel
         dst_panel = self.right_panel if self.active_panel == self.left_panel else self.left_panel
 
-        logger.debug(f"action_copy: src_panel={src_panel.remote}, dst_panel={dst_panel.remote if dst_panel else 'None'}")
+        logger.debug("action_copy: src_panel=%s, dst_panel=%s", src_panel.remote, dst_panel.remote if dst_panel else None)
 
         # Log selection state of BOTH panels for debugging
-        if self.left_panel and self.left_panel.file_list:
-            logger.debug(f"action_copy: LEFT panel ({self.left_panel.remote}) selections: {self.left_panel.file_list.selected_items}")
-            logger.debug(f"action_copy: LEFT panel is_active: {self.active_panel == self.left_panel}")
-        if self.right_panel and self.right_panel.file_list:
-            logger.debug(f"action_copy: RIGHT panel ({self.right_panel.remote}) selections: {self.right_panel.file_list.selected_items}")
-            logger.debug(f"action_copy: RIGHT panel is_active: {self.active_panel == self.right_panel}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for side, panel in (("LEFT", self.left_panel), ("RIGHT", self.right_panel)):
+                if panel and panel.file_list:
+                    logger.debug("action_copy: %s panel (%s) selections: %s", side, panel.remote, panel.file_list.selected_items)
+                    logger.debug("action_copy: %s panel is_active: %s", side, self.active_panel == panel)
 
         if not dst_panel or not src_panel.file_list or not dst_panel.file_list:
             logger.debug("action_copy: Missing dst_panel or file_lists")
             return
 
         entries = src_panel.file_list.get_selected_entries()
-        logger.debug(f"action_copy: {len(entries)} entries from ACTIVE panel")
+        logger.debug("action_copy: %d entries from ACTIVE panel", len(entries))
 
         if not entries:
             logger.debug("action_copy: No entries to copy")
             return
 
         # Calculate counts and size for confirmation
-        num_files = sum(1 for e in entries if not e.is_dir)
-        num_dirs = sum(1 for e in entries if e.is_dir)
-        total_size = sum(e.size for e in entries if not e.is_dir)
+        num_files, num_dirs, total_size = summarize_entries(entries)
 
         # Show confirmation if configured
         if self.app_config.confirm_copy:
@@ -1525,73 +1740,82 @@ class RcloneCommander(App):
         logger.debug("action_copy: END")
         logger.debug("=" * 60)
 
-    def _find_partial_files_recursive(self, remote: str, dir_path: str) -> List[tuple[str, str]]:
+    def _find_partial_files_recursive(self, remote: str, dir_path: str) -> List[Tuple[str, str]]:
         """Recursively find all .partial files in a directory.
 
+        Uses one recursive, filtered rclone listing for the whole tree rather
+        than one listing per subdirectory.
+
         Returns:
             List of tuples (file_path, full_rclone_path) for each partial file found
         """
         partial_files = []
 
-        try:
-            entries = rclone_wrapper.list_directory(
-                self.rclone_path,
-                self.config_path,
-                remote,
-                dir_path,
-                self.app_config.extra_rclone_flags
-            )
+        # .partial files come and go during transfers, so this is never cached
+        entries = rclone_wrapper.list_files_recursive(
+            self.rclone_path,
+            self.config_path,
+            remote,
+            dir_path,
+            self.app_config.extra_rclone_flags,
+            include="*.partial"
+        )
+        if entries is None:
+            logger.debug("_find_partial_files_recursive: Could not list %s:%s", remote, dir_path)
+            return partial_files
 
-            for entry in entries:
-                if entry.is_dir:
-                    # Recursively search subdirectories
-                    subdir_path = os.path.join(dir_path, entry.name) if dir_path else entry.name
-                    partial_files.extend(self._find_partial_files_recursive(remote, subdir_path))
-                elif entry.name.endswith(".partial"):
-                    # Found a partial file
-                    file_path = os.path.join(dir_path, entry.name) if dir_path else entry.name
-                    full_path = f"{remote}:{file_path}"
-                    partial_files.append((entry.name, full_path))
-                    logger.debug(f"_find_partial_files_recursive: Found {full_path}")
-        except Exception as e:
-            logger.error(f"_find_partial_files_recursive: Error scanning {remote}:{dir_path}: {e}")
+        for entry in entries:
+            if entry.name.endswith(".partial"):
+                # Found a partial file
+                full_path = build_path(remote, dir_path, entry.path)
+                partial_files.append((entry.name, full_path))
+                logger.debug("_find_partial_files_recursive: Found %s", full_path)
 
         return partial_files
 
-    async def _cleanup_partial_file(self, file_path: Optional[str], filename: str, is_directory: bool = False) -> None:
+    async def _cleanup_partial_file(self, file_path: Optional[str], filenames: Tuple[str, ...], is_directory: bool = False, panel: Optional[FilePanel] = None) -> None:
         """Ask user if they want to delete the partial file after cancellation.
 
         Rclone creates partial files with pattern: filename.ext.RANDOM.partial
         Example: IMG_9366.mp4.4f20d3fc.partial
 
+        For file copies, file_path is the destination of one of filenames;
+        partial files of all of them are looked for in its directory.
+
         For directory copies, recursively searches for all .partial files in the destination directory.
+
+        Returns once the confirmation is shown; panel (the destination) is
+        refreshed after the user chose to delete the files.
         """
         if not file_path:
             return
 
-        logger.debug(f"_cleanup_partial_file: Looking for partial files (is_directory={is_directory})")
+        logger.debug("_cleanup_partial_file: Looking for partial files (is_directory=%s)", is_directory)
 
         # Parse the file_path to get remote and directory
         # Format: "remote:path/to/file" or "remote:"
         parts = file_path.split(':', 1)
         if len(parts) != 2:
-            logger.error(f"_cleanup_partial_file: Invalid path format: {file_path}")
+            logger.error("_cleanup_partial_file: Invalid path format: %s", file_path)
             return
 
         remote = parts[0]
         full_path = parts[1]
 
         partial_files = []
+        # Directory whose listing(s) the scan below reads
+        scan_root = full_path if is_directory else parent_path(full_path)
 
         if is_directory:
             # For directory copies, recursively find all .partial files in the destination directory
-            logger.debug(f"_cleanup_partial_file: Searching recursively in {remote}:{full_path}")
-            partial_files = self._find_partial_files_recursive(remote, full_path)
+            logger.debug("_cleanup_partial_file: Searching recursively in %s:%s", remote, full_path)
+            partial_files = await run_in_thread(self._find_partial_files_recursive, remote, full_path)
         else:
             # For file copies, look for partial files in the same directory
-            dir_path = os.path.dirname(full_path) if full_path else ""
+            dir_path = parent_path(full_path)
 
-            entries = rclone_wrapper.list_directory(
+            entries = await run_in_thread(
+                functools.partial(rclone_wrapper.list_directory, use_cache=False),
                 self.rclone_path,
                 self.config_path,
                 remote,
@@ -1600,14 +1824,14 @@ class RcloneCommander(App):
             )
 
             # Find partial files matching pattern: filename.*.partial
+            prefixes = tuple(f"{filename}." for filename in filenames)
             for entry in entries:
-                if entry.name.startswith(filename + ".") and entry.name.endswith(".partial"):
-                    file_path_full = f"{remote}:{os.path.join(dir_path, entry.name)}" if dir_path else f"{remote}:{entry.name}"
-                    partial_files.append((entry.name, file_path_full))
-                    logger.debug(f"_cleanup_partial_file: Found partial file: {entry.name}")
+                if entry.name.startswith(prefixes) and entry.name.endswith(".partial"):
+                    partial_files.append((entry.name, build_path(remote, dir_path, entry.name)))
+                    logger.debug("_cleanup_partial_file: Found partial file: %s", entry.name)
 
         if not partial_files:
-            logger.debug(f"_cleanup_partial_file: No partial files found")
+            logger.debug("_cleanup_partial_file: No partial files found")
             return
 
         # Create a simple confirmation modal
@@ -1615,21 +1839,28 @@ class RcloneCommander(App):
             if confirmed:
                 deleted_count = 0
                 for filename, partial_path in partial_files:
-                    logger.debug(f"_cleanup_partial_file: Deleting {partial_path}")
-                    success = rclone_wrapper.delete_file(
+                    logger.debug("_cleanup_partial_file: Deleting %s", partial_path)
+                    success = await run_in_thread(
+                        rclone_wrapper.delete_file,
                         self.rclone_path,
                         self.config_path,
                         partial_path,
-                        is_dir=False,
-                        extra_flags=self.app_config.extra_rclone_flags
+                        False,
+                        self.app_config.extra_rclone_flags
                     )
                     if success:
                         deleted_count += 1
 
+                # The scanned listings still show the deleted files
+                rclone_wrapper.listing_cache.invalidate(remote, scan_root)
+
                 if deleted_count > 0:
                     self.update_status(f"Deleted {deleted_count} partial file(s)")
                 else:
                     self.update_status(f"Failed to delete partial files")
+
+                # The panel was refreshed from the scan, before the deletes
+                await refresh_panel_async(panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
             else:
                 logger.debug("_cleanup_partial_file: User chose to keep partial file(s)")
 
@@ -1639,111 +1870,149 @@ class RcloneCommander(App):
             handle_cleanup
         )
 
+    async def _run_rclone_with_progress(self, progress_modal: ProgressModal, args: List[str], file_num: int) -> int:
+        """Run one rclone transfer, streaming its stats into progress_modal.
+
+        Returns rclone's exit code once it exits, on its own or because the
+        modal's cancel killed it (check progress_modal.cancelled).
+        """
+        process, log_path = await rclone_wrapper.run_rclone_with_progress_async(
+            self.rclone_path,
+            self.config_path,
+            args,
+            self.app_config.extra_rclone_flags,
+            self.app_config.progress_stats_interval,
+            save_log=self.app_config.progress_log_retention > 0
+        )
+
+        # Set process handle on modal so cancel button can kill it
+        progress_modal.process = process
+        if progress_modal.cancelled:
+            # Cancelled while rclone was starting
+            process.kill()
+
+        await stream_progress(process.stderr, log_path, progress_modal, file_num)
+        return await process.wait()
+
+    async def _run_transfer(self, progress_modal: ProgressModal, command: str, src_path: str, dst_path: str,
+                            file_num: int, files_from: Optional[Tuple[str, ...]] = None) -> int:
+        """Run rclone copy/move for one entry, or for the files_from names under src_path."""
+        if files_from is None:
+            return await self._run_rclone_with_progress(progress_modal, [command, src_path, dst_path], file_num)
+        with rclone_wrapper.files_from_list(files_from) as list_path:
+            return await self._run_rclone_with_progress(
+                progress_modal, [command, src_path, dst_path, '--files-from-raw', list_path], file_num
+            )
+
     async def _do_copy_operation_async(self, src_panel: FilePanel, dst_panel: FilePanel, entries: List[rclone_wrapper.FileEntry]) -> None:
         """Perform the actual copy operation with real-time progress (async version)."""
+        await self._do_transfer_operation_async("copy", src_panel, dst_panel, entries)
+
+    async def _do_transfer_operation_async(self, command: str, src_panel: FilePanel, dst_panel: FilePanel, entries: List[rclone_wrapper.FileEntry]) -> None:
+        """Copy or move entries with real-time progress.
+
+        command is "copy" or "move". A move also refreshes the source panel,
+        since entries leave it.
+        """
+        progressive, past, noun = TRANSFER_WORDING[command]
+        tag = f"_do_{command}_operation"
+        flags = self.app_config.extra_rclone_flags
+        # Panels whose listings the transfer changes
+        changed_panels = (src_panel, dst_panel) if command == "move" else (dst_panel,)
+
         # Show progress modal
-        progress_modal = ProgressModal("Copying Files", len(entries))
+        progress_modal = ProgressModal(f"{progressive} Files", len(entries))
         self.push_screen(progress_modal)
 
-        # Cleanup old logs first
-        rclone_wrapper.cleanup_old_logs("logs", self.app_config.progress_log_retention)
+        # Panel locations are fixed for the whole batch; build their paths once
+        src_prefix = build_path_prefix(src_panel.remote, src_panel.file_list.current_path)
+        dst_prefix = build_path_prefix(dst_panel.remote, dst_panel.file_list.current_path)
+        src_dir = build_path(src_panel.remote, src_panel.file_list.current_path, "")
+        dst_dir = build_path(dst_panel.remote, dst_panel.file_list.current_path, "")
 
         try:
-            for i, entry in enumerate(entries, 1):
+            done = 0
+            for names, is_dir in group_for_transfer(entries):
+                # Numbers of the entries this run covers (several for a batch of files)
+                i, last = done + 1, done + len(names)
+                done = last
+                label = names[0] if len(names) == 1 else f"Batch of {len(names)} files (one rclone run)"
                 # Update basic progress
-                progress_modal.update_progress(entry.name, i)
-
-                src_path = build_path(src_panel.remote, src_panel.file_list.current_path, entry.name)
-                # For directories, include the dir name in destination so it creates the dir
-                # For files, just use the destination directory
-                if entry.is_dir:
-                    dst_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, entry.name)
-                else:
-                    dst_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, "")
+                progress_modal.update_progress(label, i, last)
 
-                # Track destination for potential cleanup (both files and directories)
-                partial_file_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, entry.name)
+                # Destination path of the (first) name, tracked for potential cleanup
+                # (both files and directories)
+                partial_file_path = dst_prefix + names[0]
                 progress_modal.current_dst_path = partial_file_path
+                files_from = None
+                if is_dir:
+                    # Include the dir name in destination so it creates the dir
+                    src_path, dst_path = src_prefix + names[0], partial_file_path
+                elif len(names) == 1:
+                    src_path, dst_path = src_prefix + names[0], dst_dir
+                else:
+                    # One rclone run for all plain files: a single process start
+                    # and rclone's own parallel transfers
+                    src_path, dst_path, files_from = src_dir, dst_dir, names
+
+                logger.debug("%s: %s '%s' (%d-%d/%d) (is_dir=%s)", tag, progressive, label, i, last, len(entries), is_dir)
+                logger.debug("  src_path: %s", src_path)
+                logger.debug("  dst_path: %s", dst_path)
+
+                # Run rclone, streaming its stats into the modal until it exits
+                return_code = await self._run_transfer(progress_modal, command, src_path, dst_path, i, files_from)
+
+                # Check if user cancelled (cancel kills the process, which ends the run)
+                if progress_modal.cancelled:
+                    logger.debug("%s: Operation cancelled by user", tag)
+                    self.pop_screen()
+
+                    # Ask user about cleaning up partial files (works for both files and directories)
+                    scan_started = time.monotonic()
+                    await self._cleanup_partial_file(progress_modal.current_dst_path, names, is_dir, dst_panel)
+
+                    # Refresh panels to show any entries transferred before cancellation
+                    # (the destination may reuse the scan's listing)
+                    await asyncio.gather(*(
+                        refresh_panel_async(panel, self.rclone_path, self.config_path, flags,
+                                            scan_started if panel is dst_panel else None)
+                        for panel in changed_panels
+                    ))
+
+                    self.update_status(f"{noun} cancelled")
+                    return
 
-                logger.debug(f"_do_copy_operation: Copying '{entry.name}' ({i}/{len(entries)}) (is_dir={entry.is_dir})")
-                logger.debug(f"  src_path: {src_path}")
-                logger.debug(f"  dst_path: {dst_path}")
-
-                # Start rclone with progress logging
-                process, log_path = rclone_wrapper.run_rclone_with_progress(
-                    self.rclone_path,
-                    self.config_path,
-                    ['copy', src_path, dst_path],
-                    self.app_config.extra_rclone_flags,
-                    self.app_config.progress_stats_interval
-                )
-
-                # Set process handle on modal so cancel button can kill it
-                progress_modal.process = process
-
-                # Start background log monitor
-                stop_event = threading.Event()
-                progress_modal.stop_event = stop_event
-                monitor_thread = threading.Thread(
-                    target=monitor_progress_log,
-                    args=(self, log_path, progress_modal, i, stop_event),
-                    daemon=True
-                )
-                monitor_thread.start()
-
-                # Poll the process asynchronously - this allows the UI to remain responsive
-                return_code = None
-                while return_code is None:
-                    # Check if user cancelled
-                    if progress_modal.cancelled:
-                        logger.debug("_do_copy_operation: Operation cancelled by user")
-                        stop_event.set()
-                        monitor_thread.join(timeout=2)
-                        self.pop_screen()
-
-                        # Ask user about cleaning up partial files (works for both files and directories)
-                        await self._cleanup_partial_file(progress_modal.current_dst_path, entry.name, entry.is_dir)
-
-                        # Refresh destination panel to show any files that were copied before cancellation
-                        refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-
-                        self.update_status("Copy cancelled")
-                        return
-
-                    return_code = process.poll()
-                    if return_code is None:
-                        # Still running - sleep briefly using asyncio
-                        await asyncio.sleep(0.1)
-
-                # Stop the monitor
-                stop_event.set()
-                monitor_thread.join(timeout=2)
-
-                logger.debug(f"  result: {'SUCCESS' if return_code == 0 else 'FAILED'} (code={return_code})")
+                logger.debug("  result: %s (code=%s)", "SUCCESS" if return_code == 0 else "FAILED", return_code)
 
                 if return_code != 0:
                     self.pop_screen()  # Dismiss progress modal
-                    # Refresh destination panel to show any files that were copied before failure
-                    refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-                    self.update_status(f"Failed to copy {entry.name}")
-                    logger.debug("_do_copy_operation: Aborting due to failure")
+                    # Refresh panels to show any entries transferred before failure
+                    await asyncio.gather(*(
+                        refresh_panel_async(panel, self.rclone_path, self.config_path, flags)
+                        for panel in changed_panels
+                    ))
+                    self.update_status(f"Failed to {command} {label}")
+                    logger.debug("%s: Aborting due to failure", tag)
                     return
 
             # Success - dismiss modal
             self.pop_screen()
-            self.update_status(f"Copied {len(entries)} item(s)")
-            logger.debug(f"_do_copy_operation: Successfully copied {len(entries)} item(s)")
-            refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-
-            # Clear selections in source panel after successful copy
+            self.update_status(f"{past} {len(entries)} item(s)")
+            logger.debug("%s: Successfully %s %d item(s)", tag, past.lower(), len(entries))
+            await asyncio.gather(*(
+                refresh_panel_async(panel, self.rclone_path, self.config_path, flags)
+                for panel in changed_panels
+            ))
+
+            # Clear selections in source panel after a successful transfer
             if src_panel.file_list:
                 src_panel.file_list.selected_items.clear()
                 src_panel.file_list._refresh_all_items()
-                logger.debug("_do_copy_operation: Cleared selections in source panel")
+                logger.debug("%s: Cleared selections in source panel", tag)
         except Exception as e:
             # Ensure modal is dismissed on error
             self.pop_screen()
-            logger.error(f"_do_copy_operation: Exception: {e}")
+            logger.error("%s: Exception: %s", tag, e)
             raise
 
     def action_move(self) -> None:
@@ -1760,23 +2029,21 @@ class RcloneCommander(App):
         src_panel = self.active_panel
         dst_panel = self.right_panel if self.active_panel == self.left_panel else self.left_panel
 
-        logger.debug(f"action_move: src_panel={src_panel.remote}, dst_panel={dst_panel.remote if dst_panel else 'None'}")
+        logger.debug("action_move: src_panel=%s, dst_panel=%s", src_panel.remote, dst_panel.remote if dst_panel else 'None')
 
         if not dst_panel or not src_panel.file_list or not dst_panel.file_list:
             logger.debug("action_move: Missing dst_panel or file_lists")
             return
 
         entries = src_panel.file_list.get_selected_entries()
-        logger.debug(f"action_move: {len(entries)} entries selected")
+        logger.debug("action_move: %s entries selected", len(entries))
 
         if not entries:
             logger.debug("action_move: No entries to move")
             return
 
         # Calculate counts and size for confirmation
-        num_files = sum(1 for e in entries if not e.is_dir)
-        num_dirs = sum(1 for e in entries if e.is_dir)
-        total_size = sum(e.size for e in entries if not e.is_dir)
+        num_files, num_dirs, total_size = summarize_entries(entries)
 
         # Show confirmation if configured
         if self.app_config.confirm_move:
@@ -1801,113 +2068,7 @@ class RcloneCommander(App):
 
     async def _do_move_operation_async(self, src_panel: FilePanel, dst_panel: FilePanel, entries: List[rclone_wrapper.FileEntry]) -> None:
         """Perform the actual move operation with real-time progress (async version)."""
-        # Show progress modal
-        progress_modal = ProgressModal("Moving Files", len(entries))
-        self.push_screen(progress_modal)
-
-        # Cleanup old logs first
-        rclone_wrapper.cleanup_old_logs("logs", self.app_config.progress_log_retention)
-
-        try:
-            for i, entry in enumerate(entries, 1):
-                # Update basic progress
-                progress_modal.update_progress(entry.name, i)
-
-                src_path = build_path(src_panel.remote, src_panel.file_list.current_path, entry.name)
-                # For directories, include the dir name in destination so it creates the dir
-                # For files, just use the destination directory
-                if entry.is_dir:
-                    dst_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, entry.name)
-                else:
-                    dst_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, "")
-
-                # Track destination for potential cleanup (both files and directories)
-                partial_file_path = build_path(dst_panel.remote, dst_panel.file_list.current_path, entry.name)
-                progress_modal.current_dst_path = partial_file_path
-
-                logger.debug(f"_do_move_operation: Moving '{entry.name}' ({i}/{len(entries)}) (is_dir={entry.is_dir})")
-                logger.debug(f"  src_path: {src_path}")
-                logger.debug(f"  dst_path: {dst_path}")
-
-                # Start rclone with progress logging
-                process, log_path = rclone_wrapper.run_rclone_with_progress(
-                    self.rclone_path,
-                    self.config_path,
-                    ['move', src_path, dst_path],
-                    self.app_config.extra_rclone_flags,
-                    self.app_config.progress_stats_interval
-                )
-
-                # Set process handle on modal so cancel button can kill it
-                progress_modal.process = process
-
-                # Start background log monitor
-                stop_event = threading.Event()
-                progress_modal.stop_event = stop_event
-                monitor_thread = threading.Thread(
-                    target=monitor_progress_log,
-                    args=(self, log_path, progress_modal, i, stop_event),
-                    daemon=True
-                )
-                monitor_thread.start()
-
-                # Poll the process asynchronously - this allows the UI to remain responsive
-                return_code = None
-                while return_code is None:
-                    # Check if user cancelled
-                    if progress_modal.cancelled:
-                        logger.debug("_do_move_operation: Operation cancelled by user")
-                        stop_event.set()
-                        monitor_thread.join(timeout=2)
-                        self.pop_screen()
-
-                        # Ask user about cleaning up partial files (works for both files and directories)
-                        await self._cleanup_partial_file(progress_modal.current_dst_path, entry.name, entry.is_dir)
-
-                        # Refresh both panels to show any files that were moved before cancellation
-                        refresh_panel(src_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-                        refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-
-                        self.update_status("Move cancelled")
-                        return
-
-                    return_code = process.poll()
-                    if return_code is None:
-                        # Still running - sleep briefly using asyncio
-                        await asyncio.sleep(0.1)
-
-                # Stop the monitor
-                stop_event.set()
-                monitor_thread.join(timeout=2)
-
-                logger.debug(f"  result: {'SUCCESS' if return_code == 0 else 'FAILED'} (code={return_code})")
-
-                if return_code != 0:
-                    self.pop_screen()  # Dismiss progress modal
-                    # Refresh both panels to show any files that were moved before failure
-                    refresh_panel(src_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-                    refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-                    self.update_status(f"Failed to move {entry.name}")
-                    logger.debug("_do_move_operation: Aborting due to failure")
-                    return
-
-            # Success - dismiss modal
-            self.pop_screen()
-            self.update_status(f"Moved {len(entries)} item(s)")
-            logger.debug(f"_do_move_operation: Successfully moved {len(entries)} item(s)")
-            refresh_panel(src_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-            refresh_panel(dst_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
-
-            # Clear selections in source panel after successful move
-            if src_panel.file_list:
-                src_panel.file_list.selected_items.clear()
-                src_panel.file_list._refresh_all_items()
-                logger.debug("_do_move_operation: Cleared selections in source panel")
-        except Exception as e:
-            # Ensure modal is dismissed on error
-            self.pop_screen()
-            logger.error(f"_do_move_operation: Exception: {e}")
-            raise
+        await self._do_transfer_operation_async("move", src_panel, dst_panel, entries)
 
     def action_delete(self) -> None:
         """Delete selected files/directories."""
@@ -1921,26 +2082,26 @@ class RcloneCommander(App):
             return
 
         # Log detailed selection state
-        file_list = self.active_panel.file_list
-        logger.debug(f"action_delete: Active panel remote='{self.active_panel.remote}'")
-        logger.debug(f"action_delete: Active panel path='{file_list.current_path}'")
-        logger.debug(f"action_delete: Active panel cursor_row={file_list.cursor_row}")
-        logger.debug(f"action_delete: Selected items in active panel: {file_list.selected_items}")
-        logger.debug(f"action_delete: Total entries in active panel: {len(file_list.entries)}")
+        panel = self.active_panel
+        file_list = panel.file_list
+        logger.debug("action_delete: Active panel remote='%s'", self.active_panel.remote)
+        logger.debug("action_delete: Active panel path='%s'", file_list.current_path)
+        logger.debug("action_delete: Active panel cursor_row=%s", file_list.cursor_row)
+        logger.debug("action_delete: Selected items in active panel: %s", file_list.selected_items)
+        logger.debug("action_delete: Total entries in active panel: %s", len(file_list.entries))
 
         entries = file_list.get_selected_entries()
-        logger.debug(f"action_delete: {len(entries)} entries returned by get_selected_entries()")
-        if entries:
-            logger.debug(f"action_delete: Entry names: {[e.name for e in entries]}")
+        logger.debug("action_delete: %s entries returned by get_selected_entries()", len(entries))
+        if entries and logger.isEnabledFor(logging.DEBUG):
+            # Only build the name list when it will actually be logged
+            logger.debug("action_delete: Entry names: %s", [e.name for e in entries])
 
         if not entries:
             logger.debug("action_delete: No entries to delete")
             return
 
         # Calculate counts and size for confirmation
-        num_files = sum(1 for e in entries if not e.is_dir)
-        num_dirs = sum(1 for e in entries if e.is_dir)
-        total_size = sum(e.size for e in entries if not e.is_dir)
+        num_files, num_dirs, total_size = summarize_entries(entries)
 
         # Show confirmation if configured
         if self.app_config.confirm_delete:
@@ -1949,22 +2110,27 @@ class RcloneCommander(App):
                     logger.debug("action_delete: User cancelled")
                     self.update_status("Delete cancelled")
                     return
-                self._do_delete_operation(entries)
+                # Run the delete operation as a worker
+                self.run_worker(self._do_delete_operation_async(panel, entries), exclusive=True)
 
             self.push_screen(
                 ConfirmationModal("Delete", num_files, num_dirs, total_size),
                 handle_confirmation
             )
         else:
-            self._do_delete_operation(entries)
+            # Run the delete operation as a worker
+            self.run_worker(self._do_delete_operation_async(panel, entries), exclusive=True)
 
         logger.debug("action_delete: END")
         logger.debug("=" * 60)
 
-    def _do_delete_operation(self, entries: List[rclone_wrapper.FileEntry]) -> None:
-        """Perform the actual delete operation."""
+    async def _do_delete_operation_async(self, panel: FilePanel, entries: List[rclone_wrapper.FileEntry]) -> None:
+        """Perform the actual delete operation (async version).
+
+        Each rclone delete runs in a thread, so the UI stays responsive.
+        """
         # Remember cursor position before deletion
-        file_list = self.active_panel.file_list
+        file_list = panel.file_list
         old_cursor_row = file_list.cursor_row
 
         # Show progress modal
@@ -1973,23 +2139,28 @@ class RcloneCommander(App):
 
         try:
             for i, entry in enumerate(entries, 1):
-                # Update progress display
+                # Update progress display (repainted while the delete below is awaited)
                 progress_modal.update_progress(entry.name, i)
-                progress_modal.refresh()  # Force refresh of the modal
-                self.refresh()  # Force UI update
 
                 file_path = build_path(
-                    self.active_panel.remote,
-                    self.active_panel.file_list.current_path,
+                    panel.remote,
+                    file_list.current_path,
                     entry.name
                 )
 
-                logger.debug(f"_do_delete_operation: Deleting '{entry.name}' ({i}/{len(entries)}) (is_dir={entry.is_dir})")
-                logger.debug(f"  file_path: {file_path}")
+                logger.debug("_do_delete_operation: Deleting '%s' (%s/%s) (is_dir=%s)", entry.name, i, len(entries), entry.is_dir)
+                logger.debug("  file_path: %s", file_path)
 
-                success = rclone_wrapper.delete_file(self.rclone_path, self.config_path, file_path, entry.is_dir, self.app_config.extra_rclone_flags)
+                success = await run_in_thread(
+                    rclone_wrapper.delete_file,
+                    self.rclone_path,
+                    self.config_path,
+                    file_path,
+                    entry.is_dir,
+                    self.app_config.extra_rclone_flags
+                )
 
-                logger.debug(f"  result: {'SUCCESS' if success else 'FAILED'}")
+                logger.debug("  result: %s", 'SUCCESS' if success else 'FAILED')
 
                 if not success:
                     self.pop_screen()  # Dismiss progress modal
@@ -2000,22 +2171,22 @@ class RcloneCommander(App):
             # Success - dismiss modal
             self.pop_screen()
             self.update_status(f"Deleted {len(entries)} item(s)")
-            logger.debug(f"_do_delete_operation: Successfully deleted {len(entries)} item(s)")
+            logger.debug("_do_delete_operation: Successfully deleted %s item(s)", len(entries))
         except Exception as e:
             # Ensure modal is dismissed on error
             self.pop_screen()
-            logger.error(f"_do_delete_operation: Exception: {e}")
+            logger.error("_do_delete_operation: Exception: %s", e)
             raise
 
         # Refresh panel
-        refresh_panel(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+        await refresh_panel_async(panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
 
         # Restore cursor position (keep it on the same row, which will now show the next file)
         # Make sure we don't go past the end of the list
-        if file_list.row_count > 0:
-            new_cursor_row = min(old_cursor_row, file_list.row_count - 1)
+        if file_list.total_row_count > 0:
+            new_cursor_row = min(old_cursor_row, file_list.total_row_count - 1)
             file_list.move_cursor(row=new_cursor_row)
-            logger.debug(f"_do_delete_operation: Restored cursor to row {new_cursor_row}")
+            logger.debug("_do_delete_operation: Restored cursor to row %s", new_cursor_row)
 
     def action_make_directory(self) -> None:
         """Create a new directory in the active panel."""
@@ -2027,43 +2198,50 @@ class RcloneCommander(App):
             logger.debug("action_make_directory: No active panel")
             return
 
+        panel = self.active_panel
+
         async def handle_mkdir(dirname: Optional[str]) -> None:
             """Handle the directory name input."""
             if not dirname:
                 logger.debug("action_make_directory: Cancelled")
                 return
 
-            logger.debug(f"action_make_directory: Creating directory '{dirname}'")
+            logger.debug("action_make_directory: Creating directory '%s'", dirname)
 
             # Build the full path for the new directory
             dir_path = build_path(
-                self.active_panel.remote,
-                self.active_panel.file_list.current_path,
+                panel.remote,
+                panel.file_list.current_path,
                 dirname
             )
 
-            logger.debug(f"action_make_directory: Path: {dir_path}")
+            logger.debug("action_make_directory: Path: %s", dir_path)
 
-            success = rclone_wrapper.make_directory(self.rclone_path, self.config_path, dir_path, self.app_config.extra_rclone_flags)
+            success = await run_in_thread(
+                rclone_wrapper.make_directory,
+                self.rclone_path,
+                self.config_path,
+                dir_path,
+                self.app_config.extra_rclone_flags
+            )
 
             if success:
                 self.update_status(f"Created directory: {dirname}")
                 logger.debug("action_make_directory: SUCCESS")
 
                 # Refresh panel to show the new directory
-                refresh_panel(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+                await refresh_panel_async(panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
 
                 # Position cursor on the newly created directory
-                file_list = self.active_panel.file_list
+                file_list = panel.file_list
                 offset = 1 if (file_list.current_path and file_list.current_path != "/") else 0  # Account for ".." row
 
                 # Find the new directory in the entries
-                for i, entry in enumerate(file_list.entries):
-                    if entry.name == dirname and entry.is_dir:
-                        target_row = i + offset
-                        file_list.move_cursor(row=target_row)
-                        logger.debug(f"action_make_directory: Cursor positioned on '{dirname}' at row {target_row}")
-                        break
+                index = file_list.index_of(dirname)
+                if index is not None and file_list.entries[index].is_dir:
+                    target_row = index + offset
+                    file_list.move_cursor(row=target_row)
+                    logger.debug("action_make_directory: Cursor positioned on '%s' at row %s", dirname, target_row)
             else:
                 self.update_status(f"Failed to create directory: {dirname}")
                 logger.debug("action_make_directory: FAILED")
@@ -2076,22 +2254,24 @@ class RcloneCommander(App):
         logger.debug("=" * 60)
         logger.debug("action_select_remote: START")
 
-        remote_names = config.get_remote_names(self.remotes)
-        logger.debug(f"action_select_remote: Available remotes: {remote_names}")
+        remote_names = self._remote_names
+        logger.debug("action_select_remote: Available remotes: %s", remote_names)
 
         current_remote = self.active_panel.remote if self.active_panel else ""
-        logger.debug(f"action_select_remote: Current remote: {current_remote}")
+        logger.debug("action_select_remote: Current remote: %s", current_remote)
 
         async def handle_remote_selection(selected: Optional[str]) -> None:
             """Handle the remote selection result."""
-            logger.debug(f"handle_remote_selection: Selected: {selected}")
+            logger.debug("handle_remote_selection: Selected: %s", selected)
 
             if selected and self.active_panel and self.active_panel.file_list:
-                logger.debug(f"  Switching from '{self.active_panel.remote}' to '{selected}'")
+                logger.debug("  Switching from '%s' to '%s'", self.active_panel.remote, selected)
                 self.active_panel.remote = selected
                 self.active_panel.file_list.remote_name = selected
                 self.active_panel.file_list.current_path = ""
-                refresh_panel(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+                # The old remote's rows must not be operated on while the new one lists
+                self.active_panel.file_list.clear_entries()
+                await refresh_panel_async(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
                 self.update_status(f"Switched to remote: {selected}")
             else:
                 logger.debug("  Selection cancelled or invalid")
@@ -2113,8 +2293,11 @@ class RcloneCommander(App):
             logger.debug("action_refresh_panel: No active panel")
             return
 
-        logger.debug(f"action_refresh_panel: Refreshing {self.active_panel.remote}")
-        refresh_panel(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags)
+        logger.debug("action_refresh_panel: Refreshing %s", self.active_panel.remote)
+        self.run_worker(
+            refresh_panel_async(self.active_panel, self.rclone_path, self.config_path, self.app_config.extra_rclone_flags),
+            group="refresh_panel"
+        )
         self.update_status("Panel refreshed")
 
         logger.debug("action_refresh_panel: END")
@@ -2137,19 +2320,19 @@ class RcloneCommander(App):
                 logger.debug("action_quick_search: Empty search")
                 return
 
-            logger.debug(f"action_quick_search: Searching for '{search_term}'")
+            logger.debug("action_quick_search: Searching for '%s'", search_term)
 
             # Search through entries (case-insensitive)
-            search_lower = search_term.lower()
             offset = 1 if file_list.current_path else 0
 
-            for i, entry in enumerate(file_list.entries):
-                if entry.name.lower().startswith(search_lower):
-                    target_row = i + offset
-                    file_list.move_cursor(row=target_row)
-                    logger.debug(f"action_quick_search: Found '{entry.name}' at row {target_row}")
-                    self.update_status(f"Found: {entry.name}")
-                    return
+            i = file_list.find_prefix(search_term)
+            if i is not None:
+                entry = file_list.entries[i]
+                target_row = i + offset
+                file_list.move_cursor(row=target_row)
+                logger.debug("action_quick_search: Found '%s' at row %s", entry.name, target_row)
+                self.update_status(f"Found: {entry.name}")
+                return
 
             # If no match found
             self.update_status(f"Not found: {search_term}")
@@ -2185,27 +2368,36 @@ class RcloneCommander(App):
 
         # Build the full path
         dir_path = build_path(self.active_panel.remote, file_list.current_path, entry.name)
-        logger.debug(f"action_show_dir_size: Getting size for '{dir_path}'")
+        logger.debug("action_show_dir_size: Getting size for '%s'", dir_path)
 
         # Show a temporary status while calculating
         self.update_status(f"Calculating size of {entry.name}...")
 
-        # Get size information
-        size_info = rclone_wrapper.get_directory_size(self.rclone_path, self.config_path, dir_path, self.app_config.extra_rclone_flags)
+        # rclone size walks the whole tree; run it as a worker (a new request replaces it)
+        self.run_worker(self._show_dir_size_async(entry.name, dir_path), group="dir_size", exclusive=True)
+
+        logger.debug("action_show_dir_size: END")
+        logger.debug("=" * 60)
+
+    async def _show_dir_size_async(self, name: str, dir_path: str) -> None:
+        """Get the size of dir_path, then show it in a modal."""
+        size_info = await rclone_wrapper.get_directory_size_async(
+            self.rclone_path,
+            self.config_path,
+            dir_path,
+            self.app_config.extra_rclone_flags
+        )
 
         if size_info:
             file_count = size_info.get('count', 0)
             total_size = size_info.get('bytes', 0)
-            logger.debug(f"action_show_dir_size: count={file_count}, bytes={total_size}")
+            logger.debug("action_show_dir_size: count=%s, bytes=%s", file_count, total_size)
 
             # Show the modal with the results
-            self.push_screen(DirectorySizeModal(entry.name, file_count, total_size))
+            self.push_screen(DirectorySizeModal(name, file_count, total_size))
         else:
             logger.debug("action_show_dir_size: Failed to get size")
-            self.update_status(f"Failed to calculate size of {entry.name}")
-
-        logger.debug("action_show_dir_size: END")
-        logger.debug("=" * 60)
+            self.update_status(f"Failed to calculate size of {name}")
 
     def update_status(self, message: str) -> None:
         """Update the status bar message (deprecated - status bar removed)."""
@@ -2214,55 +2406,148 @@ class RcloneCommander(App):
 
 
 # Helper functions
-def refresh_panel(panel: Optional[FilePanel], rclone_path: str, config_path: str, extra_flags: str = "") -> None:
-    """Refresh the file list in a panel."""
+def _list_for_refresh(panel: FilePanel, current_path: str, rclone_path: str, config_path: str, extra_flags: str, listed_since: Optional[float]) -> List[rclone_wrapper.FileEntry]:
+    """Get the listing refresh_panel_async shows (blocking; runs rclone on a cache miss)."""
+    entries = None
+    if listed_since is not None:
+        entries = rclone_wrapper.listing_cache.get(panel.remote, current_path, listed_since)
+    if entries is None:
+        # A refresh follows an operation or an explicit request: drop cached
+        # listings at and below this directory and re-list it from rclone
+        rclone_wrapper.listing_cache.invalidate(panel.remote, current_path)
+        entries = rclone_wrapper.list_directory(rclone_path, config_path, panel.remote, current_path, extra_flags, use_cache=False)
+    return entries
+
+
+def _show_refreshed(panel: FilePanel, current_path: str, entries: List[rclone_wrapper.FileEntry]) -> None:
+    """Display a refreshed listing and update the panel's border title."""
+    panel.file_list.set_entries(entries)
+
+    # Update border title to show current location
+    if entries or current_path == "":
+        # Successfully loaded
+        panel.file_list.border_title = f"{panel.remote}:{current_path}" if current_path else f"{panel.remote}:/"
+    else:
+        # Empty directory or error
+        panel.file_list.border_title = f"{panel.remote}:{current_path} [dim](empty or error)[/dim]"
+
+
+def _show_refresh_error(panel: FilePanel) -> None:
+    """Show an empty, error-marked panel after a failed refresh."""
+    panel.file_list.set_entries([])
+    panel.file_list.border_title = f"{panel.remote} [red](error)[/red]"
+
+
+async def refresh_panel_async(panel: Optional[FilePanel], rclone_path: str, config_path: str, extra_flags: str = "", listed_since: Optional[float] = None) -> None:
+    """Refresh the file list in a panel, listing in a thread.
+
+    If listed_since (a time.monotonic() value) is given, a cached listing
+    started at or after that moment is reused instead of running rclone
+    again, e.g. the one just made by the partial-file scan.
+
+    Refreshes of several panels can overlap via asyncio.gather. The result
+    is not shown if the panel switched remote or path, displayed another
+    listing, or started a navigation meanwhile.
+    """
     if not panel or not panel.file_list:
         return
 
-    current_path = panel.file_list.current_path
+    file_list = panel.file_list
+    token = file_list.listing_token()
+    current_path = file_list.current_path
     try:
-        entries = rclone_wrapper.list_directory(rclone_path, config_path, panel.remote, current_path, extra_flags)
-        panel.file_list.set_entries(entries)
+        entries = await run_in_thread(
+            _list_for_refresh, panel, current_path, rclone_path, config_path, extra_flags, listed_since
+        )
+    except Exception as e:
+        logger.debug("refresh_panel_async: %s", e)
+        entries = None
+    if not file_list.can_show_refresh(token):
+        logger.debug("refresh_panel_async: dropping stale refresh of %s:%s", token[0], current_path)
+        return
+    if entries is None:
+        _show_refresh_error(panel)
+    else:
+        _show_refreshed(panel, current_path, entries)
+
 
-        # Update border title to show current location
-        if entries or current_path == "":
-            # Successfully loaded
-            panel.file_list.border_title = f"{panel.remote}:{current_path}" if current_path else f"{panel.remote}:/"
+def summarize_entries(entries: List[rclone_wrapper.FileEntry]) -> Tuple[int, int, int]:
+    """Count files and directories and total the file sizes in one pass.
+
+    Returns:
+        Tuple of (num_files, num_dirs, total_size)
+    """
+    num_files = num_dirs = total_size = 0
+    for entry in entries:
+        if entry.is_dir:
+            num_dirs += 1
         else:
-            # Empty directory or error
-            panel.file_list.border_title = f"{panel.remote}:{current_path} [dim](empty or error)[/dim]"
-    except Exception as e:
-        # Handle any errors during listing
-        panel.file_list.set_entries([])
-        panel.file_list.border_title = f"{panel.remote} [red](error)[/red]"
+            num_files += 1
+            total_size += entry.size
+    return num_files, num_dirs, total_size
 
 
 def navigate_up(current_path: str) -> str:
     """Navigate up one directory level."""
-    if not current_path:
-        return ""
+    stripped = current_path.rstrip('/')
+    cut = stripped.rfind('/')
+    if cut > 0:
+        return stripped[:cut]
+
+    # At a top-level entry: absolute (local filesystem) paths go to root "/",
+    # relative (remote) paths to the remote's root ""
+    return "/" if current_path.startswith('/') else ""
+
+
+def join_path(current_path: str, name: str) -> str:
+    """Join an rclone path and a name.
+
+    rclone paths always use "/", so this is plain string joining rather
+    than os.path.join.
+    """
+    if current_path and not current_path.endswith("/"):
+        return f"{current_path}/{name}"
+    return current_path + name
 
-    # Handle absolute paths (local filesystem)
-    if current_path.startswith('/'):
-        parts = current_path.rstrip('/').split('/')
-        # If we're at a top-level directory like "/Users", go to root "/"
-        if len(parts) == 2:
-            return "/"
-        # Otherwise, go up one level
-        return '/'.join(parts[:-1]) if len(parts) > 1 else "/"
 
-    # Handle relative paths (remote filesystems)
-    parts = current_path.rstrip('/').split('/')
-    return '/'.join(parts[:-1]) if len(parts) > 1 else ""
+def parent_path(path: str) -> str:
+    """Directory part of an rclone path ("/" for a top-level absolute path)."""
+    head, sep, _ = path.rpartition("/")
+    return head or sep
 
 
 def build_path(remote: str, current_path: str, filename: str) -> str:
     """Build a full rclone path."""
     if filename:
-        return f"{remote}:{os.path.join(current_path, filename)}"
+        return build_path_prefix(remote, current_path) + filename
     return f"{remote}:{current_path}"
 
 
+def group_for_transfer(entries: List[rclone_wrapper.FileEntry]) -> List[Tuple[Tuple[str, ...], bool]]:
+    """Split entries into rclone runs as (names, is_dir) pairs.
+
+    One run per directory, and all plain files in one run (rclone
+    --files-from-raw) at the position of the first of them, so the runs
+    keep the entries' order. Entries in display order (directories first)
+    therefore still go directories first, then the files.
+    """
+    files = tuple(entry.name for entry in entries if not entry.is_dir)
+    runs: List[Tuple[Tuple[str, ...], bool]] = []
+    for entry in entries:
+        if entry.is_dir:
+            runs.append(((entry.name,), True))
+        elif files:
+            # The first plain file brings in all of them
+            runs.append((files, False))
+            files = ()
+    return runs
+
+
+def build_path_prefix(remote: str, current_path: str) -> str:
+    """Build the prefix that build_path(remote, current_path, name) puts before name."""
+    return f"{remote}:{join_path(current_path, '')}"
+
+
 def main():
     """Run the application."""
     app = RcloneCommander()
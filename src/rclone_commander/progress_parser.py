@@ -16,11 +16,17 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import re
+import sys
 import logging
+from dataclasses import dataclass
 from typing import Optional, NamedTuple
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+ (defined here rather than taken
+# from config, so parsing progress doesn't load the app configuration)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class FileProgress(NamedTuple):
     """Progress data for a single file being transferred."""
@@ -31,8 +37,13 @@ class FileProgress(NamedTuple):
     eta: str = ""
 
 
-class ProgressData(NamedTuple):
-    """Structured progress data extracted from rclone logs."""
+@dataclass(**DATACLASS_SLOTS)
+class ProgressData:
+    """Structured progress data extracted from rclone logs.
+
+    Mutable, so parsing updates fields in place instead of rebuilding the
+    whole record for every matched line.
+    """
     # Overall progress
     transferred_str: str = ""  # e.g., "15.031 MiB"
     total_str: str = ""  # e.g., "233.367 MiB"
@@ -46,172 +57,103 @@ class ProgressData(NamedTuple):
     transferring_files: tuple = ()  # tuple of FileProgress instances
 
 
-# Regex patterns for parsing rclone output
-# Example: "Transferred:          15.031 MiB / 233.367 MiB, 6%, 817.606 KiB/s, ETA 4m33s"
-TRANSFERRED_PATTERN = re.compile(
-    r'Transferred:\s+([\d.]+\s+\w+)\s+/\s+([\d.]+\s+\w+),\s+(\d+)%,\s+([\d.]+\s+\w+/s),\s+ETA\s+(.+)'
+# One pattern for all three kinds of progress line, so a line costs a single
+# regex scan; the outer group that matched (match.lastgroup) names the kind.
+# rclone prints these at the start of a line (indentation aside), so the
+# pattern is used with match(): a line that isn't one fails at its first
+# characters instead of being scanned at every offset.
+PROGRESS_PATTERN = re.compile(
+    r'[ \t]*(?:'
+    # Example: "Transferred:          15.031 MiB / 233.367 MiB, 6%, 817.606 KiB/s, ETA 4m33s"
+    r'(?P<bytes>Transferred:\s+(?P<done>[\d.]+\s+\w+)\s+/\s+(?P<total>[\d.]+\s+\w+),\s+(?P<pct>\d+)%,'
+    r'\s+(?P<speed>[\d.]+\s+\w+/s),\s+ETA\s+(?P<eta>.+))'
+    # Example: "Transferred:            0 / 1, 0%"
+    r'|(?P<files>Transferred:\s+(?P<files_done>\d+)\s+/\s+(?P<files_total>\d+),\s+\d+%)'
+    # Example: " * filename.mp4:  6% /233.367Mi, 817.618Ki/s, 4m33s"
+    r'|(?P<file>\*\s+(?P<name>.+?):\s+(?P<file_pct>\d+)%\s+/(?P<size>[\d.]+\w+),'
+    r'\s+(?P<file_speed>[\d.]+\s*\w+/s),\s+(?P<file_eta>.+)))'
 )
 
-# Example: "Transferred:            0 / 1, 0%"
-FILES_PATTERN = re.compile(
-    r'Transferred:\s+(\d+)\s+/\s+(\d+),\s+\d+%'
-)
-
-# Example: " * filename.mp4:  6% /233.367Mi, 817.618Ki/s, 4m33s"
-TRANSFERRING_PATTERN = re.compile(
-    r'\*\s+(.+?):\s+(\d+)%\s+/([\d.]+\w+),\s+([\d.]+\s*\w+/s),\s+(.+)'
-)
+# Bound match method: the progress stream runs this on every candidate line
+_match_progress = PROGRESS_PATTERN.match
 
 
-def parse_progress_line(line: str, current_data: Optional[ProgressData] = None) -> Optional[ProgressData]:
-    """Parse a single line from rclone log and update progress data.
+def _file_progress(match: "re.Match") -> FileProgress:
+    """Build a FileProgress from a PROGRESS_PATTERN match of kind "file"."""
+    return FileProgress(
+        filename=match.group('name').strip(),
+        percentage=int(match.group('file_pct')),
+        size=match.group('size'),
+        speed=match.group('file_speed'),
+        eta=match.group('file_eta').strip()
+    )
 
-    Args:
-        line: A line from the rclone log file
-        current_data: The current ProgressData to update (or None to create new)
 
-    Returns:
-        Updated ProgressData if the line contained progress info, None otherwise
-    """
-    if current_data is None:
-        current_data = ProgressData()
-
-    line = line.strip()
-
-    # Try to match the transferred bytes line
-    match = TRANSFERRED_PATTERN.search(line)
-    if match:
-        return current_data._replace(
-            transferred_str=match.group(1),
-            total_str=match.group(2),
-            overall_percentage=int(match.group(3)),
-            overall_speed=match.group(4),
-            overall_eta=match.group(5)
-        )
-
-    # Try to match the files transferred line
-    match = FILES_PATTERN.search(line)
-    if match:
-        return current_data._replace(
-            files_transferred=int(match.group(1)),
-            total_files=int(match.group(2))
-        )
-
-    # Try to match the current file transfer line
-    match = TRANSFERRING_PATTERN.search(line)
-    if match:
-        return current_data._replace(
-            current_file=match.group(1).strip(),
-            file_percentage=int(match.group(2)),
-            file_size=match.group(3),
-            file_speed=match.group(4),
-            file_eta=match.group(5).strip()
-        )
-
-    # Line didn't match any pattern
-    return None
+def _apply_totals(progress: ProgressData, match: "re.Match") -> None:
+    """Update progress in place from a "bytes" or "files" match."""
+    if match.lastgroup == 'bytes':
+        progress.transferred_str = match.group('done')
+        progress.total_str = match.group('total')
+        progress.overall_percentage = int(match.group('pct'))
+        progress.overall_speed = match.group('speed')
+        progress.overall_eta = match.group('eta').strip()
+    else:
+        progress.files_transferred = int(match.group('files_done'))
+        progress.total_files = int(match.group('files_total'))
 
 
 def parse_log_content(content: str) -> Optional[ProgressData]:
     """Parse multiple lines from rclone log and extract the latest progress.
 
+    Lines before the last stats block are skipped unparsed.
+
     Args:
         content: Content from rclone log file (can be multiple lines)
 
     Returns:
         ProgressData with the latest progress information, or None if no progress found
     """
+    # Only the newest stats block matters: it starts at the second-to-last
+    # "Transferred:" line (bytes, then file count), so skip everything before it
+    last = content.rfind("Transferred:")
+    if last > 0:
+        block = content.rfind("Transferred:", 0, last)
+        content = content[content.rfind("\n", 0, last if block < 0 else block) + 1:]
+
     progress = ProgressData()
     found_any = False
-    transferring_files = []
+    # Keyed by filename so a repeated file replaces its earlier line in O(1)
+    transferring_files = {}
 
     # We need to process the content in chunks to handle the "Transferring:" section
     # which lists multiple files at once
-    lines = content.splitlines()
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Try to match the transferred bytes line
-        match = TRANSFERRED_PATTERN.search(line)
-        if match:
-            progress = progress._replace(
-                transferred_str=match.group(1),
-                total_str=match.group(2),
-                overall_percentage=int(match.group(3)),
-                overall_speed=match.group(4),
-                overall_eta=match.group(5)
-            )
-            found_any = True
-            i += 1
-            continue
-
-        # Try to match the files transferred line
-        match = FILES_PATTERN.search(line)
-        if match:
-            progress = progress._replace(
-                files_transferred=int(match.group(1)),
-                total_files=int(match.group(2))
-            )
-            found_any = True
-            i += 1
-            continue
-
+    for line in content.splitlines():
         # Check for "Transferring:" section header
-        if line.startswith("Transferring:") or "Transferring:" in line:
+        if "Transferring:" in line:
             # Clear previous transferring files when we see a new section
-            transferring_files = []
-            i += 1
+            transferring_files = {}
             # Continue to parse file progress lines that follow
             continue
 
-        # Try to match individual file transfer lines
-        match = TRANSFERRING_PATTERN.search(line)
-        if match:
-            file_progress = FileProgress(
-                filename=match.group(1).strip(),
-                percentage=int(match.group(2)),
-                size=match.group(3),
-                speed=match.group(4),
-                eta=match.group(5).strip()
-            )
-            # Add to list (avoid duplicates by filename)
-            # Remove any existing entry with same filename first
-            transferring_files = [f for f in transferring_files if f.filename != file_progress.filename]
-            transferring_files.append(file_progress)
-            found_any = True
-            i += 1
+        # Cheap substring check first: every progress line has a percentage,
+        # most other log lines don't
+        if "%" not in line:
+            continue
+        match = _match_progress(line)
+        if match is None:
             continue
 
-        i += 1
+        if match.lastgroup != 'file':
+            _apply_totals(progress, match)
+        else:
+            file_progress = _file_progress(match)
+            # Re-insert so a repeated file moves to the end, as it was last reported
+            transferring_files.pop(file_progress.filename, None)
+            transferring_files[file_progress.filename] = file_progress
+        found_any = True
 
     # Update progress with the collected transferring files
     if transferring_files:
-        progress = progress._replace(transferring_files=tuple(transferring_files))
+        progress.transferring_files = tuple(transferring_files.values())
 
     return progress if found_any else None
-
-
-def tail_log_file(log_path: str, last_position: int = 0) -> tuple[str, int]:
-    """Read new content from a log file since last position.
-
-    Args:
-        log_path: Path to the log file
-        last_position: Last read position in the file
-
-    Returns:
-        Tuple of (new_content, new_position)
-    """
-    try:
-        with open(log_path, 'r') as f:
-            f.seek(last_position)
-            new_content = f.read()
-            new_position = f.tell()
-            return new_content, new_position
-    except FileNotFoundError:
-        # Log file doesn't exist yet
-        return "", last_position
-    except Exception as e:
-        logger.error(f"Error reading log file {log_path}: {e}")
-        return "", last_position
@@ -15,18 +15,35 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import asyncio
+import io
 import subprocess
 import json
 import os
+import time
 import logging
-from typing import List, Dict, Optional, NamedTuple
-from datetime import datetime
+import tempfile
+import functools
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import IO, Iterable, Iterator, List, Dict, Optional, NamedTuple, Tuple
+
+from . import config
 
 logger = logging.getLogger(__name__)
 
 
 class FileEntry(NamedTuple):
-    """Represents a file or directory entry."""
+    """Represents a file or directory entry.
+
+    A NamedTuple already has no per-instance __dict__ (88 bytes per entry);
+    a slotted dataclass would save 8 bytes but is ~2.5x slower to build,
+    and listings build one of these per entry.
+    """
     name: str
     path: str
     size: int
@@ -35,20 +52,32 @@ class FileEntry(NamedTuple):
     mime_type: str = ""
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@functools.lru_cache(maxsize=4096)
 def format_size(size: int, is_dir: bool = False) -> str:
-    """Format file size in human-readable format."""
+    """Format file size in human-readable format.
+
+    Memoized: listings repeat the same sizes (0, 4096, ...) a lot.
+    """
     if is_dir:
         return "<DIR>"
 
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f}{unit}"
-        size /= 1024.0
-    return f"{size:.1f}PB"
+    if size < 1024:
+        return f"{size:.1f}B"
+    # Largest unit the size reaches: 1024**idx <= size, i.e. 10*idx bits
+    idx = min((size.bit_length() - 1) // 10, 5)
+    return f"{size / (1 << (idx * 10)):.1f}{_SIZE_UNITS[idx]}"
 
 
-def run_rclone_command(rclone_path: str, config_path: Optional[str], args: List[str], extra_flags: str = "") -> subprocess.CompletedProcess:
-    """Run an rclone command."""
+@functools.lru_cache(maxsize=32)
+def _command_prefix(rclone_path: str, config_path: Optional[str], extra_flags: str = "") -> Tuple[str, ...]:
+    """The argv head shared by every rclone call: binary, --config, extra flags.
+
+    Memoized: the same settings are used for the whole session, so the
+    extra_flags string is only split once.
+    """
     cmd = [rclone_path]
     if config_path:
         cmd.extend(['--config', config_path])
@@ -58,120 +87,486 @@ def run_rclone_command(rclone_path: str, config_path: Optional[str], args: List[
         # Split by whitespace to handle multiple flags
         cmd.extend(extra_flags.split())
 
-    cmd.extend(args)
+    return tuple(cmd)
+
 
-    # Log the full command for debugging
-    logger.debug("=" * 80)
-    logger.debug("🚀 EXECUTING RCLONE COMMAND:")
-    logger.debug(f"   {' '.join(cmd)}")
-    logger.debug("=" * 80)
+def _build_command(rclone_path: str, config_path: Optional[str], args: List[str], extra_flags: str = "") -> List[str]:
+    """Build an rclone argv: binary, --config, extra flags, then args."""
+    return [*_command_prefix(rclone_path, config_path, extra_flags), *args]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    # Log the result
-    logger.debug(f"   Return code: {result.returncode}")
-    if result.stdout:
-        logger.debug(f"   stdout: {result.stdout[:500]}")  # First 500 chars
-    if result.stderr:
-        logger.debug(f"   stderr: {result.stderr[:500]}")  # First 500 chars
-    logger.debug("=" * 80)
+def run_rclone_command(rclone_path: str, config_path: Optional[str], args: List[str], extra_flags: str = "", capture_output: bool = True) -> subprocess.CompletedProcess:
+    """Run an rclone command.
+
+    With capture_output=False, for commands where only the return code
+    matters, stdout is discarded and stderr is kept only for debug logging
+    (result.stdout/stderr are None otherwise).
+    """
+    cmd = _build_command(rclone_path, config_path, args, extra_flags)
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        # Log the full command for debugging
+        logger.debug("=" * 80)
+        logger.debug("🚀 EXECUTING RCLONE COMMAND:")
+        logger.debug("   %s", ' '.join(cmd))
+        logger.debug("=" * 80)
+
+    if capture_output:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    else:
+        stderr = subprocess.PIPE if debug else subprocess.DEVNULL
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=stderr, text=True)
+
+    if debug:
+        # Log the result
+        logger.debug("   Return code: %s", result.returncode)
+        if result.stdout:
+            logger.debug("   stdout: %s", result.stdout[:500])  # First 500 chars
+        if result.stderr:
+            logger.debug("   stderr: %s", result.stderr[:500])  # First 500 chars
+        logger.debug("=" * 80)
 
     return result
 
 
-def list_directory(rclone_path: str, config_path: Optional[str], remote: str, path: str = "", extra_flags: str = "") -> List[FileEntry]:
-    """List files and directories in a remote path.
+def _path_within(path: str, parent: str) -> bool:
+    """True if path is parent or below it; an empty parent contains everything."""
+    return not parent or path == parent or path.startswith(parent.rstrip('/') + '/')
 
-    All remotes including 'local' are now handled uniformly through rclone.
-    Ensure [local] is configured in your rclone.conf as type=local.
+
+class ListingCache:
+    """Thread-safe LRU cache of directory listings with a TTL.
+
+    Keyed by (remote, path). Only successful listings are stored, so a
+    failed lsjson is always retried. Listings are shared between callers;
+    treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[FileEntry]]]" = OrderedDict()
+        # (remote, path) -> when it was last invalidated; kept for one TTL
+        self._invalidated: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, remote: str, path: str, listed_since: Optional[float] = None) -> Optional[List[FileEntry]]:
+        """Return the cached listing, or None if missing or expired.
+
+        With listed_since (a time.monotonic() value), only a listing that
+        was started at or after that moment is returned.
+        """
+        key = (remote, path)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if time.monotonic() - item[0] > self.ttl:
+                del self._entries[key]
+                return None
+            if listed_since is not None and item[0] < listed_since:
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def put(self, remote: str, path: str, entries: List[FileEntry], listed_at: Optional[float] = None) -> None:
+        """Store a listing, evicting the least recently used one if full.
+
+        listed_at is when the listing was started (time.monotonic()); it
+        defaults to now. A listing started before an invalidate() covering
+        remote:path is dropped, since it may predate the change.
+        """
+        key = (remote, path)
+        if listed_at is None:
+            listed_at = time.monotonic()
+        with self._lock:
+            for (inv_remote, inv_path), invalidated_at in self._invalidated.items():
+                if (listed_at < invalidated_at and inv_remote == remote
+                        and _path_within(path, inv_path)):
+                    return
+            self._entries[key] = (listed_at, entries)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, remote: str, path: str = "") -> None:
+        """Drop the listing of remote:path and of everything below it.
+
+        An empty path (or "/") drops every cached listing for the remote.
+        Listings of those paths still in flight are not stored when they
+        finish (see put).
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == remote and _path_within(key[1], path)
+            ]
+            for key in stale:
+                del self._entries[key]
+            # A listing started over a TTL ago would expire on arrival anyway
+            self._invalidated = {
+                key: invalidated_at for key, invalidated_at in self._invalidated.items()
+                if now - invalidated_at <= self.ttl
+            }
+            self._invalidated[(remote, path)] = now
+
+    def clear(self) -> None:
+        """Drop every cached listing."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by both panels; rclone lsjson is the main navigation latency
+listing_cache = ListingCache()
+
+
+def _entry_from_json(entry: Dict) -> FileEntry:
+    """Convert one lsjson object into a FileEntry."""
+    return FileEntry(
+        name=entry.get('Name', ''),
+        path=entry.get('Path', ''),
+        size=entry.get('Size', 0),
+        modified=entry.get('ModTime', ''),
+        is_dir=entry.get('IsDir', False),
+        mime_type=entry.get('MimeType', '')
+    )
+
+
+def _parse_lsjson_stream(stdout: IO[str]) -> List[FileEntry]:
+    """Parse lsjson output incrementally, one object per line.
+
+    rclone writes "[", then one object per line (comma-terminated), then
+    "]". Each line is decoded as it arrives, so neither the full stdout
+    string nor the list of dicts is ever held in memory. Output in any
+    other layout is parsed as a whole document instead.
+
+    Raises:
+        json.JSONDecodeError: If the output is not valid lsjson.
     """
+    first = stdout.readline()
+    if first.strip() != '[':
+        return [_entry_from_json(entry) for entry in json.loads(first + stdout.read())]
 
+    entries = []
+    for line in stdout:
+        item = line.strip().rstrip(',')
+        if not item or item == ']':
+            continue
+        entries.append(_entry_from_json(json.loads(item)))
+    return entries
+
+
+def _lsjson_command(rclone_path: str, config_path: Optional[str], remote: str, path: str, extra_flags: str, lsjson_args: Tuple[str, ...] = ()) -> Tuple[List[str], str]:
+    """Build the rclone lsjson argv for remote:path; returns (cmd, remote_path)."""
     remote_path = f"{remote}:{path}" if path else f"{remote}:"
 
-    result = run_rclone_command(rclone_path, config_path, [
+    cmd = _build_command(rclone_path, config_path, [
         'lsjson',
         '--no-mimetype',
         '--no-modtime',
+        *lsjson_args,
         remote_path
     ], extra_flags)
+    return cmd, remote_path
+
+
+def _lsjson(rclone_path: str, config_path: Optional[str], remote: str, path: str, extra_flags: str, lsjson_args: Tuple[str, ...] = ()) -> Optional[List[FileEntry]]:
+    """Run rclone lsjson on remote:path; None if the listing failed."""
+    cmd, remote_path = _lsjson_command(rclone_path, config_path, remote, path, extra_flags, lsjson_args)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("_lsjson: %s", ' '.join(cmd))
+
+    # stderr goes to a temp file so a chatty rclone can't block on a full pipe
+    with tempfile.TemporaryFile(mode='w+') as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+        try:
+            with process.stdout:
+                entries = _parse_lsjson_stream(process.stdout)
+        except json.JSONDecodeError as e:
+            logger.debug("_lsjson: invalid JSON from rclone for %s: %s", remote_path, e)
+            entries = None
+        finally:
+            returncode = process.wait()
+
+        if returncode != 0:
+            if logger.isEnabledFor(logging.DEBUG):
+                stderr_file.seek(0)
+                logger.debug("_lsjson: rclone returned %s: %s", returncode, stderr_file.read()[:500])
+            return None
+
+    return entries
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill process if it is still running and reap it.
+
+    The wait is shielded so the process is reaped even while the calling
+    task is being cancelled.
+    """
+    if process.returncode is None:
+        process.kill()
+    await asyncio.shield(process.wait())
+
+
+async def _lsjson_async(rclone_path: str, config_path: Optional[str], remote: str, path: str, extra_flags: str) -> Optional[List[FileEntry]]:
+    """Async _lsjson; the rclone process is killed if the awaiting task is cancelled."""
+    cmd, remote_path = _lsjson_command(rclone_path, config_path, remote, path, extra_flags)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("_lsjson_async: %s", ' '.join(cmd))
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        await _kill_process(process)
+        raise
+
+    if process.returncode != 0:
+        logger.debug("_lsjson_async: rclone returned %s: %r", process.returncode, stderr[:500])
+        return None
+    try:
+        return _parse_lsjson_stream(io.StringIO(stdout.decode()))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        logger.debug("_lsjson_async: invalid JSON from rclone for %s: %s", remote_path, e)
+        return None
+
+
+# rclone flags that don't change what a plain local listing returns; with
+# any other extra flag the listing is left to rclone. Flags in the first set
+# take a separate value argument.
+_LISTING_NEUTRAL_VALUE_FLAGS = frozenset({
+    '--transfers', '--checkers', '--multi-thread-streams', '--buffer-size',
+    '--bwlimit', '--retries', '--low-level-retries', '--stats', '--stats-log-level',
+    '--log-level', '--log-file', '--tpslimit',
+})
+_LISTING_NEUTRAL_FLAGS = frozenset({'-v', '-vv', '--verbose', '-q', '--quiet', '-P', '--progress', '--stats-one-line'})
+
+# Stat calls run in a thread pool only for directories at least this large
+LOCAL_STAT_THREADS = 16
+_LOCAL_PARALLEL_STAT_MIN = 64
+
+
+def _flags_are_listing_neutral(extra_flags: str) -> bool:
+    """True if extra_flags can't affect a local directory listing."""
+    args = iter(extra_flags.split())
+    for arg in args:
+        name = arg.split('=', 1)[0]
+        if name in _LISTING_NEUTRAL_VALUE_FLAGS:
+            if '=' not in arg:
+                next(args, None)
+        elif name not in _LISTING_NEUTRAL_FLAGS:
+            return False
+    return True
+
+
+def _can_list_natively(config_path: Optional[str], remote: str, path: str, extra_flags: str) -> bool:
+    """Check whether remote:path can be listed with os.scandir instead of rclone.
+
+    Only a remote configured as nothing but "type = local" qualifies (any
+    other option, e.g. links or skip_links, changes the listing), only for
+    absolute paths, and only when neither extra_flags nor RCLONE_* environment
+    variables could filter or alter the result.
+    """
+    if not config_path or not os.path.isabs(path):
+        return False
+    if not _flags_are_listing_neutral(extra_flags):
+        return False
+    if any(key.startswith('RCLONE_') and key not in ('RCLONE_CONFIG', 'RCLONE_PATH') for key in os.environ):
+        return False
+    try:
+        options = config.load_remotes(config_path).get(remote)
+    except Exception as e:
+        logger.debug("_can_list_natively: can't read %s: %s", config_path, e)
+        return False
+    return options is not None and options.keys() <= {'type', 'description'} and options.get('type') == 'local'
 
-    if result.returncode != 0:
-        return []
 
+def _scandir_entry(entry: os.DirEntry) -> Optional[FileEntry]:
+    """Convert a DirEntry like rclone's local backend would; None to skip it.
+
+    Without -L/--links rclone skips symlinks, and it never lists special
+    files (sockets, FIFOs, devices). Directories report size -1.
+    """
     try:
-        entries = json.loads(result.stdout)
-        return [
-            FileEntry(
-                name=entry.get('Name', ''),
-                path=entry.get('Path', ''),
-                size=entry.get('Size', 0),
-                modified=entry.get('ModTime', ''),
-                is_dir=entry.get('IsDir', False),
-                mime_type=entry.get('MimeType', '')
-            )
-            for entry in entries
-        ]
-    except json.JSONDecodeError:
+        if entry.is_symlink():
+            return None
+        if entry.is_dir(follow_symlinks=False):
+            return FileEntry(name=entry.name, path=entry.name, size=-1, modified='', is_dir=True)
+        if not entry.is_file(follow_symlinks=False):
+            return None
+        size = entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        # Vanished or unreadable between scandir and stat
+        return None
+    return FileEntry(name=entry.name, path=entry.name, size=size, modified='', is_dir=False)
+
+
+def _scandir_listing(path: str) -> Optional[List[FileEntry]]:
+    """List a local directory directly; None if it can't be read.
+
+    Large directories stat their files from a thread pool (the same idea
+    as rclone's parallel checkers), which pays off on network mounts.
+    """
+    try:
+        with os.scandir(path) as it:
+            dir_entries = list(it)
+    except OSError as e:
+        logger.debug("_scandir_listing: %s: %s", path, e)
+        return None
+
+    if len(dir_entries) >= _LOCAL_PARALLEL_STAT_MIN:
+        with ThreadPoolExecutor(max_workers=LOCAL_STAT_THREADS) as pool:
+            results = pool.map(_scandir_entry, dir_entries, chunksize=32)
+            entries = [entry for entry in results if entry is not None]
+    else:
+        entries = [entry for entry in map(_scandir_entry, dir_entries) if entry is not None]
+    return entries
+
+
+def list_directory(rclone_path: str, config_path: Optional[str], remote: str, path: str = "", extra_flags: str = "", use_cache: bool = True) -> List[FileEntry]:
+    """List files and directories in a remote path.
+
+    All remotes including 'local' are handled through rclone; ensure [local]
+    is configured in your rclone.conf as type=local. A plain local remote is
+    listed with os.scandir instead when nothing could make the result differ
+    from rclone's (see _can_list_natively), skipping the subprocess.
+
+    Listings are served from listing_cache when use_cache is True (and
+    fresh); successful listings are always stored in it. Returns [] on error.
+    """
+    if use_cache:
+        cached = listing_cache.get(remote, path)
+        if cached is not None:
+            logger.debug("list_directory: cache hit for %s:%s", remote, path)
+            return cached
+
+    listed_at = time.monotonic()
+    if _can_list_natively(config_path, remote, path, extra_flags):
+        entries = _scandir_listing(path)
+    else:
+        entries = _lsjson(rclone_path, config_path, remote, path, extra_flags)
+    if entries is None:
         return []
 
+    listing_cache.put(remote, path, entries, listed_at)
+    return entries
 
-def copy_file(rclone_path: str, config_path: Optional[str], source: str, dest: str, extra_flags: str = "") -> bool:
-    """Copy a file or directory using rclone."""
-    logger.debug(f"copy_file: source='{source}', dest='{dest}'")
 
-    result = run_rclone_command(rclone_path, config_path, ['copy', source, dest], extra_flags)
-    logger.debug(f"copy_file: rclone returncode={result.returncode}")
-    if result.returncode != 0:
-        logger.debug(f"copy_file: stderr={result.stderr}")
-    return result.returncode == 0
+async def list_directory_async(rclone_path: str, config_path: Optional[str], remote: str, path: str = "", extra_flags: str = "", use_cache: bool = True) -> List[FileEntry]:
+    """Async list_directory, with the same caching and native local listing.
 
+    If the awaiting task is cancelled, a running rclone lsjson is killed
+    rather than left to finish in a thread. Returns [] on error.
+    """
+    if use_cache:
+        cached = listing_cache.get(remote, path)
+        if cached is not None:
+            logger.debug("list_directory_async: cache hit for %s:%s", remote, path)
+            return cached
+
+    listed_at = time.monotonic()
+    if _can_list_natively(config_path, remote, path, extra_flags):
+        entries = await asyncio.get_running_loop().run_in_executor(None, _scandir_listing, path)
+    else:
+        entries = await _lsjson_async(rclone_path, config_path, remote, path, extra_flags)
+    if entries is None:
+        return []
 
-def move_file(rclone_path: str, config_path: Optional[str], source: str, dest: str, extra_flags: str = "") -> bool:
-    """Move a file or directory using rclone."""
-    logger.debug(f"move_file: source='{source}', dest='{dest}'")
+    listing_cache.put(remote, path, entries, listed_at)
+    return entries
+
+
+def list_files_recursive(rclone_path: str, config_path: Optional[str], remote: str, path: str = "", extra_flags: str = "", include: Optional[str] = None) -> Optional[List[FileEntry]]:
+    """List every file below remote:path with a single rclone call.
+
+    rclone walks the tree itself (concurrently, per --checkers), instead of
+    one lsjson subprocess per directory. Entry paths are relative to path.
+    include is an rclone filter pattern, e.g. "*.partial". Results are not
+    cached. Returns None on error.
+    """
+    lsjson_args: Tuple[str, ...] = ('--recursive', '--files-only')
+    if include:
+        lsjson_args += ('--include', include)
+    return _lsjson(rclone_path, config_path, remote, path, extra_flags, lsjson_args)
 
-    result = run_rclone_command(rclone_path, config_path, ['move', source, dest], extra_flags)
-    logger.debug(f"move_file: rclone returncode={result.returncode}")
-    if result.returncode != 0:
-        logger.debug(f"move_file: stderr={result.stderr}")
-    return result.returncode == 0
+
+@contextmanager
+def files_from_list(names: Iterable[str]) -> Iterator[str]:
+    """Write names to a temporary list file for rclone's --files-from-raw.
+
+    Yields the file's path; the file is removed on exit. Names are taken
+    literally (no comment or whitespace handling), relative to the source root.
+    """
+    fd, list_path = tempfile.mkstemp(prefix="rclone-commander-", suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as list_file:
+            list_file.writelines(f"{name}\n" for name in names)
+        yield list_path
+    finally:
+        try:
+            os.remove(list_path)
+        except OSError as e:
+            logger.debug("files_from_list: could not remove %s: %s", list_path, e)
 
 
 def delete_file(rclone_path: str, config_path: Optional[str], path: str, is_dir: bool = False, extra_flags: str = "") -> bool:
     """Delete a file or directory using rclone."""
-    logger.debug(f"delete_file: path='{path}', is_dir={is_dir}")
+    logger.debug("delete_file: path='%s', is_dir=%s", path, is_dir)
 
     cmd = ['purge', path] if is_dir else ['delete', path]
-    result = run_rclone_command(rclone_path, config_path, cmd, extra_flags)
-    logger.debug(f"delete_file: rclone returncode={result.returncode}")
+    result = run_rclone_command(rclone_path, config_path, cmd, extra_flags, capture_output=False)
+    logger.debug("delete_file: rclone returncode=%s", result.returncode)
     if result.returncode != 0:
-        logger.debug(f"delete_file: stderr={result.stderr}")
+        logger.debug("delete_file: stderr=%s", result.stderr)
     return result.returncode == 0
 
 
 def make_directory(rclone_path: str, config_path: Optional[str], path: str, extra_flags: str = "") -> bool:
     """Create a directory."""
-    result = run_rclone_command(rclone_path, config_path, ['mkdir', path], extra_flags)
+    result = run_rclone_command(rclone_path, config_path, ['mkdir', path], extra_flags, capture_output=False)
     return result.returncode == 0
 
 
-def get_directory_size(rclone_path: str, config_path: Optional[str], path: str, extra_flags: str = "") -> Optional[Dict]:
-    """Get size information for a directory using rclone size --json."""
-    logger.debug(f"get_directory_size: path='{path}'")
+async def get_directory_size_async(rclone_path: str, config_path: Optional[str], path: str, extra_flags: str = "") -> Optional[Dict]:
+    """Get size information for a directory using rclone size --json.
 
-    result = run_rclone_command(rclone_path, config_path, ['size', '--json', path], extra_flags)
-    logger.debug(f"get_directory_size: rclone returncode={result.returncode}")
-
-    if result.returncode != 0:
-        logger.debug(f"get_directory_size: stderr={result.stderr}")
+    Runs rclone as an asyncio subprocess, so no thread is tied up and
+    several calls can run side by side under asyncio.gather. If the awaiting
+    task is cancelled, the rclone process is killed and reaped.
+    """
+    logger.debug("get_directory_size_async: path='%s'", path)
+
+    cmd = _build_command(rclone_path, config_path, ['size', '--json', path], extra_flags)
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except asyncio.CancelledError:
+        await _kill_process(process)
+        raise
+    logger.debug("get_directory_size_async: rclone returncode=%s", process.returncode)
+
+    if process.returncode != 0:
+        logger.debug("get_directory_size_async: stderr=%r", stderr[:500])
         return None
 
     try:
-        size_info = json.loads(result.stdout)
-        logger.debug(f"get_directory_size: count={size_info.get('count')}, bytes={size_info.get('bytes')}")
+        size_info = json.loads(stdout)
+        logger.debug("get_directory_size_async: count=%s, bytes=%s", size_info.get('count'), size_info.get('bytes'))
         return size_info
     except json.JSONDecodeError as e:
-        logger.debug(f"get_directory_size: JSON decode error={e}")
+        logger.debug("get_directory_size_async: JSON decode error=%s", e)
         return None
 
 
@@ -186,38 +581,44 @@ def cleanup_old_logs(logs_dir: str = "logs", keep_count: int = 5) -> None:
         if not os.path.exists(logs_dir):
             return
 
-        # Get all .log files in the directory
-        log_files = []
-        for filename in os.listdir(logs_dir):
-            if filename.endswith('.log'):
-                filepath = os.path.join(logs_dir, filename)
-                # Get modification time
-                mtime = os.path.getmtime(filepath)
-                log_files.append((filepath, mtime))
+        # Get all .log files in the directory with their modification time
+        with os.scandir(logs_dir) as it:
+            log_files = [(entry.path, entry.stat().st_mtime) for entry in it
+                         if entry.name.endswith('.log') and entry.is_file()]
 
-        # Sort by modification time (newest first)
-        log_files.sort(key=lambda x: x[1], reverse=True)
+        # Only the newest keep_count are needed, not a full sort
+        keep = {filepath for filepath, _ in heapq.nlargest(keep_count, log_files, key=lambda x: x[1])}
 
         # Delete all but the most recent keep_count files
-        for filepath, _ in log_files[keep_count:]:
+        for filepath, _ in log_files:
+            if filepath in keep:
+                continue
             try:
                 os.remove(filepath)
-                logger.debug(f"Deleted old log file: {filepath}")
+                logger.debug("Deleted old log file: %s", filepath)
             except Exception as e:
-                logger.error(f"Failed to delete log file {filepath}: {e}")
+                logger.error("Failed to delete log file %s: %s", filepath, e)
 
     except Exception as e:
-        logger.error(f"Error cleaning up log files: {e}")
+        logger.error("Error cleaning up log files: %s", e)
+
 
+# Sequence number for progress log filenames
+_log_seq = itertools.count(1)
 
-def run_rclone_with_progress(
+# Fixed flags for progress runs; --no-update-modtime prevents unnecessary updates
+_PROGRESS_FLAGS = ('--log-level', 'INFO', '--no-update-modtime')
+
+
+async def run_rclone_with_progress_async(
     rclone_path: str,
     config_path: Optional[str],
     args: List[str],
     extra_flags: str = "",
-    stats_interval: str = "1s"
-) -> tuple[subprocess.Popen, str]:
-    """Run an rclone command with progress logging.
+    stats_interval: str = "1s",
+    save_log: bool = True
+) -> Tuple[asyncio.subprocess.Process, Optional[str]]:
+    """Start an rclone command whose log (stats included) streams to stderr.
 
     Args:
         rclone_path: Path to rclone executable
@@ -225,51 +626,47 @@ def run_rclone_with_progress(
         args: Command arguments
         extra_flags: Extra flags to pass to rclone
         stats_interval: Stats update interval (e.g., "1s", "500ms")
+        save_log: Whether to pick a file under logs/ to keep the log in
 
     Returns:
-        Tuple of (process, log_file_path)
+        Tuple of (process, log_file_path); the caller reads process.stderr
+        and saves it to log_file_path, which is None when save_log is False
     """
-    # Create logs directory if it doesn't exist
-    logs_dir = "logs"
-    os.makedirs(logs_dir, exist_ok=True)
-
-    # Generate unique log filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    operation = args[0] if args else "operation"
-    log_filename = f"rclone_{operation}_{timestamp}.log"
-    log_path = os.path.join(logs_dir, log_filename)
-
-    cmd = [rclone_path]
-    if config_path:
-        cmd.extend(['--config', config_path])
-
-    # Add extra flags if provided
-    if extra_flags:
-        cmd.extend(extra_flags.split())
-
-    # Add progress-specific flags
-    cmd.extend([
+    log_path = None
+    if save_log:
+        # Create logs directory if it doesn't exist
+        logs_dir = "logs"
+        os.makedirs(logs_dir, exist_ok=True)
+
+        # Unique log filename: timestamp, then pid and a per-process sequence
+        # number so runs started in the same second never collide
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        operation = args[0] if args else "operation"
+        log_filename = f"rclone_{operation}_{timestamp}_{os.getpid()}_{next(_log_seq):04d}.log"
+        log_path = os.path.join(logs_dir, log_filename)
+
+    # Progress-specific flags go after the shared prefix (no --log-file: rclone logs to stderr)
+    cmd = [
+        *_command_prefix(rclone_path, config_path, extra_flags),
         '--stats', stats_interval,
-        '--log-file', log_path,
-        '--log-level', 'INFO',
-        '--no-update-modtime'  # Prevent unnecessary updates
-    ])
-
-    cmd.extend(args)
-
-    # Log the full command for debugging
-    logger.debug("=" * 80)
-    logger.debug("🚀 EXECUTING RCLONE COMMAND WITH PROGRESS:")
-    logger.debug(f"   {' '.join(cmd)}")
-    logger.debug(f"   Log file: {log_path}")
-    logger.debug("=" * 80)
+        *_PROGRESS_FLAGS,
+        *args
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # Log the full command for debugging
+        logger.debug("=" * 80)
+        logger.debug("🚀 EXECUTING RCLONE COMMAND WITH PROGRESS:")
+        logger.debug("   %s", ' '.join(cmd))
+        logger.debug("   Log file: %s", log_path)
+        logger.debug("=" * 80)
 
     # Start the process in the background
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
     )
 
     return process, log_path
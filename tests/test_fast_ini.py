@@ -0,0 +1,92 @@
+"""Tests for the fast_ini reader against configparser."""
+import configparser
+from pathlib import Path
+
+import pytest
+
+from rclone_commander.fast_ini import parse_ini_files, parse_ini_text
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+RCLONE_CONF = """\
+[DEFAULT]
+chunk_size = 8M
+
+[local]
+type = local
+
+[gdrive]
+type = drive
+scope = drive
+token = {"access_token":"ya29.a0","token_type":"Bearer","expiry":"2025-01-01T00:00:00Z"}
+team_drive =
+
+[s3]
+type: s3
+provider = AWS
+endpoint: https://s3.example.com:9000/path?a=b
+Access_Key_ID = AKIA
+chunk_size = 64M
+
+; a hand-edited remote
+[webdav]
+# comment before a key
+type = webdav
+url = https://dav.example.com
+description = first line
+    second line
+
+    after a blank line
+# a comment inside the value
+    after a comment
+user = me
+"""
+
+APP_INI = """\
+[General]
+app_title = rclone-commander
+extra_rclone_flags = --transfers 6 --checkers 6
+default_left_remote =
+
+[Behavior]
+progress_log_retention: 3
+"""
+
+
+def configparser_sections(*texts):
+    """What configparser (no interpolation) reads, as {section: {key: value}}."""
+    parser = configparser.ConfigParser(interpolation=None)
+    for text in texts:
+        parser.read_string(text)
+    return {section: dict(parser[section]) for section in parser.sections()}
+
+
+@pytest.mark.parametrize("text", [
+    RCLONE_CONF,
+    APP_INI,
+    (REPO_ROOT / "config" / "rclone-commander.ini").read_text(),
+    "[DEFAULT]\na=1\n[r]\ntype: local\nx = 1\n",
+    "[a]\n  x = 1\n  y = 2\n    more of y\nz = 3\n",
+    "[a] ; c\nx = 1\n[b]   # c\ny = 2\n",
+    "[a]b]\nx = 1\n",
+], ids=["rclone.conf", "app.ini", "shipped-app.ini", "default-and-colon",
+        "indented-keys", "header-comment", "bracket-in-name"])
+def test_parse_ini_text_matches_configparser(text):
+    assert parse_ini_text(text) == configparser_sections(text)
+
+
+def test_default_section_is_not_a_remote():
+    sections = parse_ini_text("[DEFAULT]\na=1\n[r]\ntype: local\nx = 1\n")
+    assert sections == {'r': {'a': '1', 'type': 'local', 'x': '1'}}
+
+
+def test_parse_ini_files_matches_configparser(tmp_path):
+    base = "[DEFAULT]\nshared = base\n\n[General]\ndebug = false\napp_title = base\n"
+    user = "[General]\ndebug = true\n\n[DEFAULT]\nextra = user\n"
+    paths = []
+    for name, text in (("base.ini", base), ("user.ini", user)):
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(str(path))
+
+    assert parse_ini_files(paths) == configparser_sections(base, user)